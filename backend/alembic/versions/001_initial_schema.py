@@ -9,6 +9,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -19,12 +20,17 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Create course_type enum
-    course_type = sa.Enum(
+    # Create course_type enum with explicit DDL; create_type=False stops
+    # SQLAlchemy from emitting its own CREATE/DROP TYPE in undocumented
+    # order (and re-checking existence on every run)
+    course_type = postgresql.ENUM(
         'appetizer', 'soup', 'salad', 'main', 'side', 'dessert', 'beverage', 'other',
-        name='coursetype'
+        name='coursetype', create_type=False
+    )
+    op.execute(
+        "CREATE TYPE coursetype AS ENUM "
+        "('appetizer', 'soup', 'salad', 'main', 'side', 'dessert', 'beverage', 'other')"
     )
-    # course_type.create(op.get_bind(), checkfirst=True)
 
     # Create dishes table
     op.create_table(
@@ -38,7 +44,7 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_dishes_id'), 'dishes', ['id'], unique=False)
+    # No index on dishes.id: the PK already provides a unique btree
     op.create_index(op.f('ix_dishes_name'), 'dishes', ['name'], unique=False)
 
     # Create parsed_ingredients table
@@ -55,7 +61,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['dish_id'], ['dishes.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_parsed_ingredients_id'), 'parsed_ingredients', ['id'], unique=False)
 
     # Create shopping_list_items table
     op.create_table(
@@ -73,18 +78,14 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['dish_id'], ['dishes.id'], ondelete='SET NULL'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_shopping_list_items_id'), 'shopping_list_items', ['id'], unique=False)
 
 
 def downgrade() -> None:
-    op.drop_index(op.f('ix_shopping_list_items_id'), table_name='shopping_list_items')
     op.drop_table('shopping_list_items')
-    op.drop_index(op.f('ix_parsed_ingredients_id'), table_name='parsed_ingredients')
     op.drop_table('parsed_ingredients')
     op.drop_index(op.f('ix_dishes_name'), table_name='dishes')
-    op.drop_index(op.f('ix_dishes_id'), table_name='dishes')
     op.drop_table('dishes')
     
     # Drop the enum type
-    sa.Enum(name='coursetype').drop(op.get_bind(), checkfirst=True)
+    op.execute("DROP TYPE IF EXISTS coursetype")
 
@@ -46,10 +46,22 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id')
     )
 
-    # Create indexes
-    op.create_index('ix_ingredients_name', 'ingredients', ['name'])
-    op.create_index('ix_ingredient_instances_ingredient_id', 'ingredient_instances', ['ingredient_id'])
-    op.create_index('ix_ingredient_instances_dish_id', 'ingredient_instances', ['dish_id'])
+    # Create indexes CONCURRENTLY so builds never block writes; the
+    # autocommit block commits the surrounding migration transaction first
+    # (CONCURRENTLY cannot run inside one)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ingredients_name', 'ingredients', ['name'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_ingredient_instances_ingredient_id', 'ingredient_instances', ['ingredient_id'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_ingredient_instances_dish_id', 'ingredient_instances', ['dish_id'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
 
     # Drop old parsed_ingredients table
     op.drop_table('parsed_ingredients')
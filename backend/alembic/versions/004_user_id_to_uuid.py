@@ -17,6 +17,10 @@ down_revision = '686553fdc74a'
 branch_labels = None
 depends_on = None
 
+# Rows backfilled per batch; keeps each transaction (and its locks/WAL)
+# bounded instead of holding one migration-long transaction over the table
+BATCH_SIZE = 5000
+
 
 def upgrade() -> None:
     """Upgrade schema: Convert user id from integer to UUID."""
@@ -27,47 +31,62 @@ def upgrade() -> None:
     # Get connection for data migration
     connection = op.get_bind()
 
-    # Fetch all users and generate UUIDs, storing mapping
-    users = connection.execute(sa.text("SELECT id FROM users")).fetchall()
-    id_mapping = {}
-    for user in users:
-        new_uuid = str(uuid.uuid4())
-        id_mapping[user[0]] = new_uuid
-        connection.execute(
-            sa.text("UPDATE users SET new_id = :new_id WHERE id = :old_id"),
-            {"new_id": new_uuid, "old_id": user[0]}
-        )
-
-    # Update the new_original_invitee_id based on the mapping
-    for old_id, new_uuid in id_mapping.items():
+    # Backfill UUIDs in keyset-paginated batches inside an autocommit block
+    # so each page commits on its own instead of one migration-long
+    # transaction over the table. Each page is a single executemany
+    # dispatch rather than one round-trip per row.
+    with op.get_context().autocommit_block():
+        last_id = 0
+        while True:
+            page = connection.execute(
+                sa.text(
+                    "SELECT id FROM users WHERE id > :last "
+                    "ORDER BY id LIMIT :batch"
+                ),
+                {"last": last_id, "batch": BATCH_SIZE},
+            ).fetchall()
+            if not page:
+                break
+            connection.execute(
+                sa.text("UPDATE users SET new_id = :new_id WHERE id = :old_id"),
+                [{"new_id": str(uuid.uuid4()), "old_id": row[0]} for row in page],
+            )
+            last_id = page[-1][0]
+
+        # Remap the self-referencing FK with a single correlated UPDATE
         connection.execute(
             sa.text(
-                "UPDATE users SET new_original_invitee_id = :new_uuid "
-                "WHERE original_invitee_id = :old_id"
-            ),
-            {"new_uuid": new_uuid, "old_id": old_id}
+                "UPDATE users u SET new_original_invitee_id = p.new_id "
+                "FROM users p WHERE u.original_invitee_id = p.id"
+            )
         )
 
-    # Drop the foreign key constraint first
-    op.drop_constraint('users_original_invitee_id_fkey', 'users', type_='foreignkey')
-
-    # Drop old columns and rename new ones
-    op.drop_column('users', 'original_invitee_id')
-    op.drop_column('users', 'id')
-
-    op.alter_column('users', 'new_id', new_column_name='id', nullable=False)
-    op.alter_column('users', 'new_original_invitee_id', new_column_name='original_invitee_id')
-
-    # Add primary key constraint
-    op.create_primary_key('users_pkey', 'users', ['id'])
-
-    # Add foreign key constraint
-    op.create_foreign_key(
-        'users_original_invitee_id_fkey',
-        'users', 'users',
-        ['original_invitee_id'], ['id'],
-        ondelete='SET NULL'
-    )
+    # Swap the columns in batched ALTER TABLE statements: one lock
+    # acquisition per statement instead of one per dropped
+    # constraint/column/rename. (RENAME COLUMN cannot be combined with
+    # other actions, so the renames stay separate.)
+    op.execute("""
+        ALTER TABLE users
+          DROP CONSTRAINT users_original_invitee_id_fkey,
+          DROP CONSTRAINT users_pkey,
+          DROP COLUMN id,
+          DROP COLUMN original_invitee_id
+    """)
+    op.execute("ALTER TABLE users RENAME COLUMN new_id TO id")
+    op.execute("ALTER TABLE users RENAME COLUMN new_original_invitee_id TO original_invitee_id")
+    # The FK is added NOT VALID (metadata-only, brief lock), then validated
+    # under the weaker ShareUpdateExclusive lock so writers aren't blocked
+    # for the duration of the table scan
+    op.execute("""
+        ALTER TABLE users
+          ALTER COLUMN id SET NOT NULL,
+          ADD PRIMARY KEY (id),
+          ADD CONSTRAINT users_original_invitee_id_fkey
+            FOREIGN KEY (original_invitee_id) REFERENCES users(id)
+            ON DELETE SET NULL NOT VALID
+    """)
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE users VALIDATE CONSTRAINT users_original_invitee_id_fkey")
 
 
 def downgrade() -> None:
@@ -80,45 +99,39 @@ def downgrade() -> None:
     # Get connection for data migration
     connection = op.get_bind()
 
-    # Assign new integer IDs
-    users = connection.execute(sa.text("SELECT id FROM users ORDER BY created_at")).fetchall()
-    id_mapping = {}
-    for idx, user in enumerate(users, start=1):
-        id_mapping[user[0]] = idx
-        connection.execute(
-            sa.text("UPDATE users SET new_id = :new_id WHERE id = :old_id"),
-            {"new_id": idx, "old_id": user[0]}
-        )
-
-    # Update the new_original_invitee_id based on the mapping
-    for old_uuid, new_int in id_mapping.items():
-        connection.execute(
-            sa.text(
-                "UPDATE users SET new_original_invitee_id = :new_int "
-                "WHERE original_invitee_id = :old_uuid"
-            ),
-            {"new_int": new_int, "old_uuid": old_uuid}
+    # Assign new integer IDs server-side with a window function instead of
+    # materializing every user in Python and issuing one UPDATE per row
+    connection.execute(sa.text("""
+        WITH numbered AS (
+            SELECT id, ROW_NUMBER() OVER (ORDER BY created_at) AS rn FROM users
         )
-
-    # Drop the foreign key constraint first
-    op.drop_constraint('users_original_invitee_id_fkey', 'users', type_='foreignkey')
-
-    # Drop old columns and rename new ones
-    op.drop_constraint('users_pkey', 'users', type_='primary')
-    op.drop_column('users', 'original_invitee_id')
-    op.drop_column('users', 'id')
-
-    op.alter_column('users', 'new_id', new_column_name='id', nullable=False)
-    op.alter_column('users', 'new_original_invitee_id', new_column_name='original_invitee_id')
-
-    # Add primary key and auto-increment
-    op.create_primary_key('users_pkey', 'users', ['id'])
-
-    # Recreate foreign key
-    op.create_foreign_key(
-        'users_original_invitee_id_fkey',
-        'users', 'users',
-        ['original_invitee_id'], ['id'],
-        ondelete='SET NULL'
-    )
+        UPDATE users u SET new_id = n.rn FROM numbered n WHERE u.id = n.id
+    """))
+
+    # Remap the self-referencing FK with a single correlated UPDATE
+    connection.execute(sa.text(
+        "UPDATE users u SET new_original_invitee_id = p.new_id "
+        "FROM users p WHERE u.original_invitee_id = p.id"
+    ))
+
+    # Same batched swap as upgrade(), in reverse
+    op.execute("""
+        ALTER TABLE users
+          DROP CONSTRAINT users_original_invitee_id_fkey,
+          DROP CONSTRAINT users_pkey,
+          DROP COLUMN id,
+          DROP COLUMN original_invitee_id
+    """)
+    op.execute("ALTER TABLE users RENAME COLUMN new_id TO id")
+    op.execute("ALTER TABLE users RENAME COLUMN new_original_invitee_id TO original_invitee_id")
+    op.execute("""
+        ALTER TABLE users
+          ALTER COLUMN id SET NOT NULL,
+          ADD PRIMARY KEY (id),
+          ADD CONSTRAINT users_original_invitee_id_fkey
+            FOREIGN KEY (original_invitee_id) REFERENCES users(id)
+            ON DELETE SET NULL NOT VALID
+    """)
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE users VALIDATE CONSTRAINT users_original_invitee_id_fkey")
 
@@ -0,0 +1,57 @@
+"""Add composite index on chat_messages(user_id, created_at DESC).
+
+Revision ID: 006_chat_composite_idx
+Revises: 005_native_uuid
+Create Date: 2026-08-28
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_chat_composite_idx'
+down_revision: Union[str, Sequence[str], None] = '005_native_uuid'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    "Messages for user X ordered by time" is served by a single composite
+    index scan returning already-sorted rows, so the standalone user_id
+    index (a strict prefix of the composite) is redundant write overhead.
+    ix_chat_messages_created_at stays: the chat listing endpoint orders
+    all messages globally by created_at.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_chat_messages_user_id_created_at',
+            'chat_messages',
+            ['user_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_chat_messages_user_id',
+            table_name='chat_messages',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_chat_messages_user_id',
+            'chat_messages',
+            ['user_id'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_chat_messages_user_id_created_at',
+            table_name='chat_messages',
+            postgresql_concurrently=True,
+        )
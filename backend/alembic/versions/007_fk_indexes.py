@@ -0,0 +1,58 @@
+"""Add missing indexes on foreign key columns.
+
+Revision ID: 007_fk_indexes
+Revises: 006_chat_composite_idx
+Create Date: 2026-08-28
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_fk_indexes'
+down_revision: Union[str, Sequence[str], None] = '006_chat_composite_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    FKs with ON DELETE SET NULL/CASCADE but no index force a sequential
+    scan of the child table on every parent delete. Audit of all FKs
+    found three uncovered: ingredients.store_id, shopping_list_items.dish_id
+    and users.original_invitee_id (ingredient_instances and chat_messages
+    are already covered).
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ingredients_store_id', 'ingredients', ['store_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_shopping_list_items_dish_id', 'shopping_list_items', ['dish_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_users_original_invitee_id', 'users', ['original_invitee_id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_original_invitee_id', table_name='users',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_shopping_list_items_dish_id', table_name='shopping_list_items',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_ingredients_store_id', table_name='ingredients',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,36 @@
+"""Drop redundant non-unique indexes on primary key columns.
+
+Revision ID: 008_drop_pk_indexes
+Revises: 007_fk_indexes
+Create Date: 2026-08-28
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_drop_pk_indexes'
+down_revision: Union[str, Sequence[str], None] = '007_fk_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    001 created extra non-unique indexes on id columns that already have
+    the PK's unique btree: pure write amplification with zero read
+    benefit. Databases migrated before 001 stopped creating them shed
+    the indexes here (IF EXISTS covers fresh installs).
+    """
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_dishes_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_parsed_ingredients_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_shopping_list_items_id")
+
+
+def downgrade() -> None:
+    """Downgrade schema: the redundant indexes are intentionally not recreated."""
+    pass
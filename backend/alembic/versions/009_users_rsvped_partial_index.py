@@ -0,0 +1,43 @@
+"""Add partial index for the RSVP'd-users query.
+
+Revision ID: 009_rsvped_partial_idx
+Revises: 008_drop_pk_indexes
+Create Date: 2026-08-28
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009_rsvped_partial_idx'
+down_revision: Union[str, Sequence[str], None] = '008_drop_pk_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The public RSVP list selects WHERE has_rsvped = true ORDER BY
+    rsvped_at. A partial index on rsvped_at over just the RSVP'd subset
+    serves that query pre-sorted and stays tiny, unlike a full index on a
+    skewed boolean column.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_rsvped', 'users', ['rsvped_at'],
+            postgresql_where=sa.text('has_rsvped = true'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_rsvped', table_name='users',
+            postgresql_concurrently=True,
+        )
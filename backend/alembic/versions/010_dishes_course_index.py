@@ -0,0 +1,41 @@
+"""Index dishes.course for the filtered dish listing.
+
+Revision ID: 010_dishes_course_idx
+Revises: 009_rsvped_partial_idx
+Create Date: 2026-08-28
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010_dishes_course_idx'
+down_revision: Union[str, Sequence[str], None] = '009_rsvped_partial_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    GET /dishes?course=... filters on course, which had no index, so
+    every filtered listing seq-scanned the table. chat_messages
+    (created_at) is already covered by ix_chat_messages_created_at.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_dishes_course', 'dishes', ['course'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_dishes_course', table_name='dishes',
+            postgresql_concurrently=True,
+        )
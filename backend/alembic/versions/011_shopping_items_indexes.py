@@ -0,0 +1,63 @@
+"""Index shopping_list_items for the filtered listing.
+
+Revision ID: 011_shopping_items_idx
+Revises: 010_dishes_course_idx
+Create Date: 2026-08-28
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011_shopping_items_idx'
+down_revision: Union[str, Sequence[str], None] = '010_dishes_course_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    list_shopping_items filters on dish_id and/or is_checked and pages
+    ordered by id. The composite (dish_id, is_checked, id) serves the
+    filtered paths pre-sorted, and a partial index over the unchecked
+    subset covers the common "still to buy" listing. The plain dish_id
+    index from 007 is a redundant prefix of the composite and is dropped.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sli_dish_checked_id', 'shopping_list_items',
+            ['dish_id', 'is_checked', 'id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_sli_unchecked', 'shopping_list_items', ['id'],
+            postgresql_where=sa.text('is_checked = false'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_shopping_list_items_dish_id',
+            table_name='shopping_list_items',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_shopping_list_items_dish_id', 'shopping_list_items',
+            ['dish_id'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_sli_unchecked', table_name='shopping_list_items',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_sli_dish_checked_id', table_name='shopping_list_items',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,49 @@
+"""Add generated normalized-name column to ingredients.
+
+Revision ID: 012_ingredient_name_norm
+Revises: 011_shopping_items_idx
+Create Date: 2026-08-28
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012_ingredient_name_norm'
+down_revision: Union[str, Sequence[str], None] = '011_shopping_items_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The normalized form of the name is computed by Postgres once per
+    write instead of per-request Python string ops, and gives searches a
+    stable, indexable expression. The per-store unique index backs the
+    duplicate checks without relying on writers normalizing first.
+    """
+    op.execute(
+        "ALTER TABLE ingredients ADD COLUMN name_norm text "
+        "GENERATED ALWAYS AS (lower(btrim(name))) STORED"
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_ingredients_store_name_norm', 'ingredients',
+            ['store_id', 'name_norm'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uq_ingredients_store_name_norm', table_name='ingredients',
+            postgresql_concurrently=True,
+        )
+    op.drop_column('ingredients', 'name_norm')
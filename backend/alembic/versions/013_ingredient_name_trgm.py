@@ -0,0 +1,45 @@
+"""Trigram index for ingredient name search.
+
+Revision ID: 013_ingredient_name_trgm
+Revises: 012_ingredient_name_norm
+Create Date: 2026-08-28
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013_ingredient_name_trgm'
+down_revision: Union[str, Sequence[str], None] = '012_ingredient_name_norm'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The ingredient search runs a leading-wildcard LIKE over name_norm,
+    which without an index is a seq-scan. A pg_trgm GIN index satisfies
+    LIKE '%term%' via trigram lookup, turning the scan into an index
+    probe proportional to the number of matches.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ingredients_name_norm_trgm', 'ingredients', ['name_norm'],
+            postgresql_using='gin',
+            postgresql_ops={'name_norm': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_ingredients_name_norm_trgm', table_name='ingredients',
+            postgresql_concurrently=True,
+        )
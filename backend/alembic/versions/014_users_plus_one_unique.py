@@ -0,0 +1,54 @@
+"""Enforce one plus-one per invitee with a unique partial index.
+
+Revision ID: 014_plus_one_unique
+Revises: 013_ingredient_name_trgm
+Create Date: 2026-08-28
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '014_plus_one_unique'
+down_revision: Union[str, Sequence[str], None] = '013_ingredient_name_trgm'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The "one plus-one per invitee" rule lived only in an application
+    pre-check, which races under concurrent requests. A unique partial
+    index over the non-NULL invitee ids enforces it in the database and
+    lets add_plus_one rely on the constraint instead of a SELECT. It
+    serves the same lookups as the plain FK index from 007, which is
+    dropped as redundant.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_users_original_invitee', 'users', ['original_invitee_id'],
+            unique=True,
+            postgresql_where=sa.text('original_invitee_id IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_users_original_invitee_id', table_name='users',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_original_invitee_id', 'users', ['original_invitee_id'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'uq_users_original_invitee', table_name='users',
+            postgresql_concurrently=True,
+        )
@@ -29,13 +29,20 @@ def upgrade() -> None:
         sa.UniqueConstraint('name')
     )
 
-    # Add store_id and is_purchased to ingredients
-    op.add_column('ingredients', sa.Column('store_id', sa.Integer(), nullable=True))
-    op.add_column('ingredients', sa.Column('is_purchased', sa.Boolean(), server_default='false', nullable=False))
-    op.create_foreign_key('fk_ingredients_store_id', 'ingredients', 'stores', ['store_id'], ['id'], ondelete='SET NULL')
-
-    # Remove old source_store column
-    op.drop_column('ingredients', 'source_store')
+    # Reshape ingredients in one ALTER TABLE: a single lock acquisition and
+    # one pass over the heap instead of four separate statements. The FK is
+    # added NOT VALID (metadata-only) and validated afterwards without
+    # blocking writers.
+    op.execute("""
+        ALTER TABLE ingredients
+          ADD COLUMN store_id INTEGER,
+          ADD COLUMN is_purchased BOOLEAN NOT NULL DEFAULT false,
+          ADD CONSTRAINT fk_ingredients_store_id FOREIGN KEY (store_id)
+            REFERENCES stores(id) ON DELETE SET NULL NOT VALID,
+          DROP COLUMN source_store
+    """)
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE ingredients VALIDATE CONSTRAINT fk_ingredients_store_id")
 
 
 def downgrade() -> None:
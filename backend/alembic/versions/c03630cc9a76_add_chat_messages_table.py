@@ -30,10 +30,19 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    # Create index on user_id for faster queries
-    op.create_index('ix_chat_messages_user_id', 'chat_messages', ['user_id'])
-    # Create index on created_at for ordering
-    op.create_index('ix_chat_messages_created_at', 'chat_messages', ['created_at'])
+    # Create indexes CONCURRENTLY (write-lock free) outside the migration
+    # transaction
+    with op.get_context().autocommit_block():
+        # Index on user_id for faster queries
+        op.create_index(
+            'ix_chat_messages_user_id', 'chat_messages', ['user_id'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        # Index on created_at for ordering
+        op.create_index(
+            'ix_chat_messages_created_at', 'chat_messages', ['created_at'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
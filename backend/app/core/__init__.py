@@ -1,6 +1,6 @@
 """Core application configuration and utilities."""
 
-from app.core.config import settings
+from app.core.config import get_settings, settings
 
-__all__ = ["settings"]
+__all__ = ["get_settings", "settings"]
 
@@ -1,5 +1,6 @@
 """Application configuration settings."""
 
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -23,6 +24,11 @@ class Settings(BaseSettings):
 
     # Database settings
     database_url: str
+    # Pool sizing: pool_size + max_overflow should cover
+    # uvicorn workers x expected concurrency per worker
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: int = 30
 
     # CORS settings
     cors_origins: list[str] = ["*"]
@@ -33,10 +39,24 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-    @property
+    @cached_property
     def sync_database_url(self) -> str:
-        """Get synchronous database URL for Alembic migrations."""
+        """Get synchronous database URL for Alembic migrations.
+
+        Computed once per Settings instance instead of re-scanning the
+        URL string on every access.
+        """
         return self.database_url.replace("+asyncpg", "")
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Return the cached application settings.
+
+    Caching keeps repeated callers (and tests that reload modules) from
+    re-reading the .env file on each construction.
+    """
+    return Settings()
+
+
+settings = get_settings()
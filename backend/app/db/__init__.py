@@ -1,6 +1,6 @@
 """Database module."""
 
-from app.db.session import get_db, engine, AsyncSessionLocal
+from app.db.session import get_db, get_db_ro, engine, execute_count, execute_one, AsyncSessionLocal
 from app.db.base import Base
 from app.db.models import (
     Dish,
@@ -12,7 +12,10 @@ from app.db.models import (
 
 __all__ = [
     "get_db",
+    "get_db_ro",
     "engine",
+    "execute_count",
+    "execute_one",
     "AsyncSessionLocal",
     "Base",
     "Dish",
@@ -1,16 +1,31 @@
 """SQLAlchemy database models."""
 
 import enum
-from datetime import datetime
+import uuid
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, Integer, String, Text, Boolean
+from sqlalchemy import Computed, DateTime, Enum, Float, ForeignKey, Integer, String, Text, Boolean, insert, select
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
 
 
+def _utcnow() -> datetime:
+    """Client-side timestamp default.
+
+    Populating created_at/updated_at in the INSERT/UPDATE itself lets
+    SQLAlchemy skip the RETURNING round-trip it needs when only the
+    server_default knows the value. The server_default stays as a safety
+    net for raw SQL inserts and migrations.
+    """
+    return datetime.now(timezone.utc)
+
+
 class CourseType(str, enum.Enum):
     """Enum for meal course types."""
 
@@ -32,7 +47,7 @@ class Store(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
     )
 
     # Relationships
@@ -40,6 +55,35 @@ class Store(Base):
         "Ingredient", back_populates="store"
     )
 
+    @classmethod
+    async def bulk_upsert(cls, session: AsyncSession, rows: list[dict]) -> None:
+        """Insert many stores in one statement, skipping existing names.
+
+        Avoids the SELECT-then-INSERT round-trip pair per row that
+        get-or-create loops incur.
+        """
+        if not rows:
+            return
+        stmt = pg_insert(cls).values(rows).on_conflict_do_nothing(
+            index_elements=["name"]
+        )
+        await session.execute(stmt)
+
+    @classmethod
+    async def upsert_many(cls, session: AsyncSession, names: list[str]) -> dict[str, int]:
+        """Insert-or-get stores by name, returning a name -> id mapping.
+
+        Two statements total regardless of batch size, instead of a
+        SELECT-then-INSERT pair per store.
+        """
+        if not names:
+            return {}
+        await cls.bulk_upsert(session, [{"name": n} for n in names])
+        rows = await session.execute(
+            select(cls.name, cls.id).where(cls.name.in_(names))
+        )
+        return dict(rows.all())
+
     def __repr__(self) -> str:
         return f"<Store(id={self.id}, name='{self.name}')>"
 
@@ -59,20 +103,24 @@ class Dish(Base):
         ),
         default=CourseType.MAIN,
         nullable=False,
+        index=True,
     )
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     servings: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     recipe_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), onupdate=_utcnow, nullable=False
     )
 
     # Relationships
     ingredient_instances: Mapped[list["IngredientInstance"]] = relationship(
-        "IngredientInstance", back_populates="dish", cascade="all, delete-orphan"
+        "IngredientInstance",
+        back_populates="dish",
+        cascade="all, delete-orphan",
+        lazy="selectin",
     )
     shopping_items: Mapped[list["ShoppingListItem"]] = relationship(
         "ShoppingListItem", back_populates="dish", cascade="all, delete-orphan"
@@ -89,24 +137,62 @@ class Ingredient(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    # Postgres-maintained normalized form; searches and uniqueness checks
+    # use this instead of per-request lower()/strip() in Python
+    name_norm: Mapped[Optional[str]] = mapped_column(
+        Text, Computed("lower(btrim(name))", persisted=True), nullable=True
+    )
     store_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("stores.id", ondelete="SET NULL"), nullable=True
     )
     unit: Mapped[str] = mapped_column(String(50), nullable=False, default="each")
     is_purchased: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), onupdate=_utcnow, nullable=False
     )
 
     # Relationships
-    store: Mapped[Optional["Store"]] = relationship("Store", back_populates="ingredients")
+    store: Mapped[Optional["Store"]] = relationship(
+        "Store", back_populates="ingredients", lazy="joined"
+    )
     instances: Mapped[list["IngredientInstance"]] = relationship(
         "IngredientInstance", back_populates="ingredient", cascade="all, delete-orphan"
     )
 
+    @classmethod
+    async def bulk_upsert(cls, session: AsyncSession, rows: list[dict]) -> None:
+        """Insert many ingredients in one statement, skipping existing names.
+
+        Single Core INSERT ... ON CONFLICT (name) DO NOTHING instead of a
+        per-row get-or-create, which costs two round-trips per ingredient.
+        """
+        if not rows:
+            return
+        stmt = pg_insert(cls).values(rows).on_conflict_do_nothing(
+            index_elements=["name"]
+        )
+        await session.execute(stmt)
+
+    @classmethod
+    async def upsert_many(
+        cls, session: AsyncSession, names: list[str], unit: str = "each"
+    ) -> dict[str, int]:
+        """Insert-or-get ingredients by name, returning a name -> id mapping.
+
+        A batch of N names costs one ON CONFLICT DO NOTHING insert plus one
+        SELECT, instead of the ~2N round-trips of per-name get-or-create.
+        """
+        if not names:
+            return {}
+        await cls.bulk_upsert(session, [{"name": n, "unit": unit} for n in names])
+        rows = await session.execute(
+            select(cls.name, cls.id).where(cls.name.in_(names))
+        )
+        return dict(rows.all())
+
     def __repr__(self) -> str:
         return f"<Ingredient(id={self.id}, name='{self.name}')>"
 
@@ -126,11 +212,15 @@ class IngredientInstance(Base):
     quantity: Mapped[float] = mapped_column(Float, nullable=False, default=1.0)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
     )
 
     # Relationships
-    ingredient: Mapped["Ingredient"] = relationship("Ingredient", back_populates="instances")
+    # Many-to-one with a single parent row, so a join is cheaper than a
+    # second SELECT
+    ingredient: Mapped["Ingredient"] = relationship(
+        "Ingredient", back_populates="instances", lazy="joined"
+    )
     dish: Mapped["Dish"] = relationship("Dish", back_populates="ingredient_instances")
 
     def __repr__(self) -> str:
@@ -153,10 +243,10 @@ class ShoppingListItem(Base):
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     is_checked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), onupdate=_utcnow, nullable=False
     )
 
     # Relationships
@@ -171,17 +261,19 @@ class User(Base):
 
     __tablename__ = "users"
 
+    # Native uuid column (16 bytes vs 36-byte text); as_uuid=False keeps the
+    # Python-side value a str, matching the API layer
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(__import__('uuid').uuid4())
+        UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4())
     )
     first_name: Mapped[str] = mapped_column(String(100), nullable=False)
     last_name: Mapped[str] = mapped_column(String(100), nullable=False)
     has_rsvped: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     original_invitee_id: Mapped[Optional[str]] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=False), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
     )
     rsvped_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
@@ -209,16 +301,31 @@ class ChatMessage(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     message: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=_utcnow, server_default=func.now(), nullable=False
     )
 
     # Relationship to user
     user: Mapped["User"] = relationship("User", back_populates="chat_messages")
 
+    @classmethod
+    async def bulk_insert(cls, session: AsyncSession, rows: list[dict]) -> None:
+        """Insert many chat messages with one executemany statement.
+
+        Core insert skips the per-row unit-of-work bookkeeping that
+        session.add() pays for each message.
+        """
+        if not rows:
+            return
+        await session.execute(insert(cls), rows)
+
     def __repr__(self) -> str:
-        preview = self.message[:50] + "..." if len(self.message) > 50 else self.message
+        # Slice one past the preview length so only the (bounded) slice is
+        # inspected, never the full message
+        preview = self.message[:51]
+        if len(preview) > 50:
+            preview = preview[:50] + "..."
         return f"<ChatMessage(id={self.id}, user_id={self.user_id}, message='{preview}')>"
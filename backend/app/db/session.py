@@ -12,11 +12,28 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
-    pool_pre_ping=True,  # Verify connections before using them (handles stale connections)
+    # Stale connections are handled by TCP keepalives (below) plus recycle;
+    # pool_pre_ping would cost a SELECT 1 round-trip on every checkout
     pool_recycle=300,  # Recycle connections after 5 minutes
+    # Size the pool explicitly; the default 5+10 serializes concurrent
+    # requests behind pool checkout under load
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    # Headroom over the default 500 so distinct statement shapes don't
+    # evict each other from the compiled-statement cache
+    query_cache_size=1200,
     connect_args={
         "statement_cache_size": 0,  # Disable prepared statements for pgbouncer
         "prepared_statement_cache_size": 0,  # Also disable prepared statement cache
+        "server_settings": {
+            # JIT warmup adds 10-100ms to short OLTP queries and never pays off here
+            "jit": "off",
+            # Detect dead connections out of band instead of pre-ping
+            "tcp_keepalives_idle": "60",
+            "tcp_keepalives_interval": "10",
+            "tcp_keepalives_count": "3",
+        },
     },
 )
 
@@ -29,9 +46,48 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Read-only session factory on an AUTOCOMMIT view of the same engine/pool:
+# SELECTs don't open an implicit transaction, so read requests skip the
+# COMMIT round-trip entirely
+AsyncReadSessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+
+async def execute_count(query) -> int:
+    """Run a scalar count query on its own session.
+
+    A session runs one statement at a time, so list endpoints use this to
+    overlap the COUNT with the page fetch via asyncio.gather instead of
+    awaiting the two round-trips back to back.
+    """
+    async with AsyncReadSessionLocal() as session:
+        result = await session.execute(query)
+        return result.scalar_one()
+
+
+async def execute_one(query):
+    """Run a single-row query on its own session and return the Row.
+
+    Same role as :func:`execute_count` for aggregates that return more
+    than one column.
+    """
+    async with AsyncReadSessionLocal() as session:
+        result = await session.execute(query)
+        return result.one()
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency that provides a database session."""
+    """Dependency that provides a read-write database session.
+
+    Dependencies must stay ``async def``: a sync dependency anywhere in a
+    route's chain makes FastAPI resolve it on the threadpool, adding a
+    handoff + context switch per request.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -42,3 +98,13 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency that provides a read-only database session.
+
+    Runs on AUTOCOMMIT with no commit/rollback bookkeeping, halving DB
+    round-trips on GET endpoints.
+    """
+    async with AsyncReadSessionLocal() as session:
+        yield session
+
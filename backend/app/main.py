@@ -1,11 +1,43 @@
 """FastAPI application entry point."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from app.core.config import settings
+from app.db.models import ChatMessage, Dish
+from app.db.session import AsyncSessionLocal
 from app.routers import chat, dishes, ingredients, recipes, shopping, stores, users
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm caches at startup.
+
+    Executes the hot list queries once with LIMIT 0 so SQLAlchemy's
+    compiled-statement cache (and the server's plan cache) are primed
+    before the first real request.
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                select(Dish).options(*dishes.DISH_FULL_LOAD).limit(0)
+            )
+            await session.execute(
+                select(ChatMessage)
+                .options(selectinload(ChatMessage.user))
+                .limit(0)
+            )
+    except Exception:
+        # Warmup is best-effort; don't block boot if the DB isn't up yet
+        pass
+    yield
+
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
@@ -29,6 +61,10 @@ Recipe & Shopping List API for managing dinner party ingredients.
     """,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    # orjson serializes the nested list responses in C and handles
+    # datetime/enum natively, cutting JSON encode time per response
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -73,4 +109,14 @@ if __name__ == "__main__":
     import uvicorn
 
     port = int(os.environ.get("PORT", 10000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvloop + httptools move the event loop and HTTP parsing into C;
+    # workers > 1 (via WEB_CONCURRENCY) needs the import string, not the
+    # app object
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1)),
+    )
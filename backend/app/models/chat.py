@@ -30,4 +30,9 @@ class ChatListResponse(BaseModel):
 
     messages: list[ChatMessageResponse]
     total: int
+    # (created_at, id) of the last message in this page; pass back as
+    # ?after=&after_id= to fetch the next page. The id breaks ties between
+    # messages sharing a timestamp. Both are None when the page is empty.
+    next_cursor: datetime | None = None
+    next_cursor_id: int | None = None
 
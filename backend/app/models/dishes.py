@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.ingredients import DishIngredientInput
 
@@ -65,8 +65,7 @@ class StoreInfo(BaseModel):
     id: int
     name: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IngredientInfo(BaseModel):
@@ -79,8 +78,7 @@ class IngredientInfo(BaseModel):
     unit: str
     is_purchased: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DishIngredientResponse(BaseModel):
@@ -92,8 +90,7 @@ class DishIngredientResponse(BaseModel):
     notes: Optional[str]
     ingredient: IngredientInfo
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DishResponse(DishBase):
@@ -106,9 +103,7 @@ class DishResponse(DishBase):
         default_factory=list, alias="ingredient_instances"
     )
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class DishListResponse(BaseModel):
@@ -125,5 +120,11 @@ class DishSummary(BaseModel):
     name: str
     course: CourseType
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DishSummaryListResponse(BaseModel):
+    """Schema for listing dishes without ingredient hydration."""
+
+    dishes: list[DishSummary]
+    total: int
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # =============================================================================
@@ -40,8 +40,7 @@ class StoreInfo(BaseModel):
     id: int
     name: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IngredientResponse(BaseModel):
@@ -56,8 +55,7 @@ class IngredientResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IngredientInstanceBase(BaseModel):
@@ -89,8 +87,7 @@ class IngredientInstanceResponse(IngredientInstanceBase):
     created_at: datetime
     ingredient: IngredientResponse
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
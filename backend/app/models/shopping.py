@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.dishes import DishSummary
 
@@ -112,8 +112,7 @@ class ShoppingListItemResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ShoppingListItemsResponse(BaseModel):
@@ -122,3 +121,6 @@ class ShoppingListItemsResponse(BaseModel):
     items: list[ShoppingListItemResponse]
     total: int
     checked_count: int
+    # id of the last item in this page; pass back as ?after_id= to fetch
+    # the next page. None when the page is empty.
+    next_cursor: Optional[int] = None
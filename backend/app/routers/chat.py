@@ -1,40 +1,62 @@
 """API routes for chat messages."""
 
+import asyncio
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.db.session import get_db
+from app.db.session import execute_count, get_db, get_db_ro
 from app.db.models import ChatMessage, User
 from app.models import ChatMessageCreate, ChatMessageResponse, ChatListResponse
+from app.routers.users import validate_user_id
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
 
-@router.get("", response_model=ChatListResponse)
+@router.get("")
 async def list_chat_messages(
-    skip: int = 0,
+    after: datetime | None = None,
+    after_id: int | None = None,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
-) -> ChatListResponse:
-    """List all chat messages with user information."""
-    result = await db.execute(
+    db: AsyncSession = Depends(get_db_ro),
+) -> ORJSONResponse:
+    """List chat messages with user information.
+
+    Pages by keyset on (created_at, id): pass the previous page's
+    ``next_cursor``/``next_cursor_id`` as ``after``/``after_id`` to fetch
+    the next page. Unlike OFFSET, the cost of a page does not grow with
+    its depth; the id tie-break keeps messages sharing a timestamp from
+    being skipped at page boundaries.
+    """
+    query = (
         select(ChatMessage)
         .options(selectinload(ChatMessage.user))
-        .order_by(ChatMessage.created_at.asc())
-        .offset(skip)
+        .order_by(ChatMessage.created_at.asc(), ChatMessage.id.asc())
         .limit(limit)
     )
-    messages = result.scalars().all()
+    if after is not None and after_id is not None:
+        query = query.where(
+            tuple_(ChatMessage.created_at, ChatMessage.id) > (after, after_id)
+        )
+    elif after is not None:
+        query = query.where(ChatMessage.created_at > after)
 
-    # Get total count
-    count_result = await db.execute(select(ChatMessage))
-    total = len(count_result.scalars().all())
+    # Overlap the page fetch and the count (on its own session) so the two
+    # round-trips run concurrently
+    result, total = await asyncio.gather(
+        db.execute(query),
+        execute_count(select(func.count()).select_from(ChatMessage)),
+    )
+    messages = result.scalars().all()
 
-    # Build response with user info
+    # Build response with user info. model_construct skips validation,
+    # which is safe here: every field comes straight from typed ORM columns
     message_responses = [
-        ChatMessageResponse(
+        ChatMessageResponse.model_construct(
             id=msg.id,
             user_id=msg.user_id,
             message=msg.message,
@@ -45,7 +67,14 @@ async def list_chat_messages(
         for msg in messages
     ]
 
-    return ChatListResponse(messages=message_responses, total=total)
+    # Serialize once and skip FastAPI's response_model re-validation pass
+    payload = ChatListResponse.model_construct(
+        messages=message_responses,
+        total=total,
+        next_cursor=messages[-1].created_at if messages else None,
+        next_cursor_id=messages[-1].id if messages else None,
+    )
+    return ORJSONResponse(payload.model_dump(mode="json"))
 
 
 @router.post("", response_model=ChatMessageResponse, status_code=201)
@@ -55,6 +84,7 @@ async def create_chat_message(
     db: AsyncSession = Depends(get_db),
 ) -> ChatMessageResponse:
     """Create a new chat message."""
+    validate_user_id(user_id)
     # Verify user exists
     user_result = await db.execute(select(User).where(User.id == user_id))
     user = user_result.scalar_one_or_none()
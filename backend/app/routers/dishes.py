@@ -1,30 +1,48 @@
 """API endpoints for dish management."""
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
 
-from app.db import get_db
+from app.db import execute_count, get_db, get_db_ro
 from app.db.models import Dish as DishModel
 from app.db.models import Ingredient as IngredientModel
 from app.db.models import IngredientInstance as IngredientInstanceModel
+from app.db.models import Store as StoreModel
 from app.db.models import CourseType as DBCourseType
 from app.models.dishes import (
     CourseType,
     DishCreate,
     DishListResponse,
     DishResponse,
+    DishSummary,
+    DishSummaryListResponse,
     DishUpdate,
 )
+from app.routers.ingredients import invalidate_ingredient_cache
 from app.services.unit_normalizer import unit_normalizer
 
 router = APIRouter(prefix="/dishes", tags=["dishes"])
 
+# Shared loader options for the fully hydrated dish payload; hoisted so the
+# Load option graph is built once and stays identity-stable for the query cache
+DISH_FULL_LOAD = (
+    selectinload(DishModel.ingredient_instances)
+    .selectinload(IngredientInstanceModel.ingredient)
+    # Stores are tiny {id, name} rows: joining them onto the ingredient
+    # SELECT beats a fourth IN-list round-trip
+    .joinedload(IngredientModel.store)
+    .load_only(StoreModel.id, StoreModel.name),
+)
+
 
-def pydantic_course_to_db(course: CourseType) -> DBCourseType:
-    """Convert Pydantic CourseType to DB CourseType."""
-    return DBCourseType(course.value)
+# Static 8-entry mapping; a dict probe beats re-running enum validation on
+# every create/update/list-filter call
+_COURSE_MAP = {course: DBCourseType(course.value) for course in CourseType}
 
 
 @router.post("/", response_model=DishResponse, status_code=status.HTTP_201_CREATED)
@@ -36,7 +54,7 @@ async def create_dish(
     # Create the dish
     db_dish = DishModel(
         name=dish.name,
-        course=pydantic_course_to_db(dish.course),
+        course=_COURSE_MAP[dish.course],
         description=dish.description,
         servings=dish.servings,
         recipe_url=dish.recipe_url,
@@ -44,108 +62,139 @@ async def create_dish(
     db.add(db_dish)
     await db.flush()
 
-    # Add ingredients
+    # Resolve all ingredient names in one IN query instead of one
+    # SELECT + flush per ingredient
+    names = {
+        ing.name.lower().strip()
+        for ing in dish.ingredients
+        if ing.name and not ing.existing_ingredient_id
+    }
+    ingredient_ids: dict[str, int] = {}
+    if names:
+        result = await db.execute(
+            select(IngredientModel.name, IngredientModel.id).where(
+                IngredientModel.name.in_(names)
+            )
+        )
+        ingredient_ids = dict(result.all())
+
+        new_rows = []
+        for ing_input in dish.ingredients:
+            if ing_input.existing_ingredient_id or not ing_input.name:
+                continue
+            name = ing_input.name.lower().strip()
+            if name in ingredient_ids:
+                continue
+            ingredient_ids[name] = None  # Placeholder until the INSERT returns
+            new_rows.append(
+                {
+                    "name": name,
+                    "store_id": ing_input.store_id,
+                    "unit": unit_normalizer.normalize(ing_input.unit),
+                }
+            )
+
+        if new_rows:
+            # One multi-row INSERT ... RETURNING instead of a flush per model
+            returned = await db.execute(
+                insert(IngredientModel)
+                .values(new_rows)
+                .returning(IngredientModel.name, IngredientModel.id)
+            )
+            ingredient_ids.update(dict(returned.all()))
+            invalidate_ingredient_cache()
+
+    # Create instances in a single pass
+    instance_rows = []
     for ing_input in dish.ingredients:
         if ing_input.existing_ingredient_id:
-            # Use existing ingredient
             ingredient_id = ing_input.existing_ingredient_id
+        elif ing_input.name:
+            ingredient_id = ingredient_ids[ing_input.name.lower().strip()]
         else:
-            # Create new ingredient
-            if not ing_input.name:
-                continue  # Skip if no name provided
-
-            # Check if ingredient already exists by name
-            query = select(IngredientModel).where(
-                IngredientModel.name == ing_input.name.lower().strip()
-            )
-            result = await db.execute(query)
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                ingredient_id = existing.id
-            else:
-                new_ingredient = IngredientModel(
-                    name=ing_input.name.lower().strip(),
-                    store_id=ing_input.store_id,
-                    unit=unit_normalizer.normalize(ing_input.unit),
-                )
-                db.add(new_ingredient)
-                await db.flush()
-                ingredient_id = new_ingredient.id
-
-        # Create instance
-        instance = IngredientInstanceModel(
-            ingredient_id=ingredient_id,
-            dish_id=db_dish.id,
-            quantity=ing_input.quantity,
-            notes=ing_input.notes,
+            continue  # Skip if no name provided
+
+        instance_rows.append(
+            {
+                "ingredient_id": ingredient_id,
+                "dish_id": db_dish.id,
+                "quantity": ing_input.quantity,
+                "notes": ing_input.notes,
+            }
         )
-        db.add(instance)
 
-    await db.flush()
+    if instance_rows:
+        # Core executemany: all instances land in one round-trip
+        await db.execute(insert(IngredientInstanceModel), instance_rows)
 
-    # Reload with relationships
-    query = (
-        select(DishModel)
-        .where(DishModel.id == db_dish.id)
-        .options(
-            selectinload(DishModel.ingredient_instances).selectinload(
-                IngredientInstanceModel.ingredient
-            ).selectinload(IngredientModel.store)
-        )
-    )
-    result = await db.execute(query)
-    db_dish = result.scalar_one()
+    # Populate the relationship on the in-memory object; the relationship-level
+    # eager loaders pull in ingredient and store, so no full reload is needed
+    await db.refresh(db_dish, ["ingredient_instances"])
 
     return db_dish
 
 
-@router.get("/", response_model=DishListResponse)
+@router.get("/")
 async def list_dishes(
     skip: int = 0,
     limit: int = 100,
     course: CourseType | None = None,
-    db: AsyncSession = Depends(get_db),
-) -> DishListResponse:
-    """List all dishes with optional filtering by course."""
-    query = select(DishModel).options(
-        selectinload(DishModel.ingredient_instances).selectinload(
-            IngredientInstanceModel.ingredient
-        ).selectinload(IngredientModel.store)
-    )
+    include: str | None = None,
+    db: AsyncSession = Depends(get_db_ro),
+) -> ORJSONResponse:
+    """List all dishes with optional filtering by course.
+
+    By default returns lightweight summaries (one query, no ingredient
+    hydration); pass ``include=ingredients`` for the full nested payload.
+    """
+    with_ingredients = include == "ingredients"
+
+    if with_ingredients:
+        query = select(DishModel).options(*DISH_FULL_LOAD)
+    else:
+        query = select(DishModel).options(
+            noload(DishModel.ingredient_instances)
+        )
 
     if course:
-        query = query.where(DishModel.course == pydantic_course_to_db(course))
+        query = query.where(DishModel.course == _COURSE_MAP[course])
 
     query = query.offset(skip).limit(limit)
-    result = await db.execute(query)
-    dishes = result.scalars().all()
 
-    # Get total count
-    count_query = select(DishModel)
+    count_query = select(func.count()).select_from(DishModel)
     if course:
         count_query = count_query.where(
-            DishModel.course == pydantic_course_to_db(course)
+            DishModel.course == _COURSE_MAP[course]
         )
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
 
-    return DishListResponse(dishes=list(dishes), total=total)
+    # Overlap the page fetch and the count (on its own session) so the two
+    # round-trips run concurrently
+    result, total = await asyncio.gather(
+        db.execute(query), execute_count(count_query)
+    )
+    dishes = result.scalars().all()
+
+    # Serialize once here and hand FastAPI a finished response; returning
+    # models would make it re-validate the whole payload against the
+    # return annotation
+    if with_ingredients:
+        payload = DishListResponse(dishes=list(dishes), total=total)
+    else:
+        payload = DishSummaryListResponse(
+            dishes=[DishSummary.model_validate(d) for d in dishes], total=total
+        )
+    return ORJSONResponse(payload.model_dump(mode="json"))
 
 
 @router.get("/{dish_id}", response_model=DishResponse)
 async def get_dish(
     dish_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> DishResponse:
     """Get a specific dish by ID."""
     query = (
         select(DishModel)
-        .options(
-            selectinload(DishModel.ingredient_instances).selectinload(
-                IngredientInstanceModel.ingredient
-            ).selectinload(IngredientModel.store)
-        )
+        .options(*DISH_FULL_LOAD)
         .where(DishModel.id == dish_id)
     )
     result = await db.execute(query)
@@ -170,11 +219,7 @@ async def update_dish(
     query = (
         select(DishModel)
         .where(DishModel.id == dish_id)
-        .options(
-            selectinload(DishModel.ingredient_instances).selectinload(
-                IngredientInstanceModel.ingredient
-            ).selectinload(IngredientModel.store)
-        )
+        .options(*DISH_FULL_LOAD)
     )
     result = await db.execute(query)
     dish = result.scalar_one_or_none()
@@ -189,26 +234,14 @@ async def update_dish(
     if dish_update.name is not None:
         dish.name = dish_update.name
     if dish_update.course is not None:
-        dish.course = pydantic_course_to_db(dish_update.course)
+        dish.course = _COURSE_MAP[dish_update.course]
     if dish_update.description is not None:
         dish.description = dish_update.description
     if dish_update.servings is not None:
         dish.servings = dish_update.servings
 
     await db.flush()
-    # Re-fetch with relationships loaded
-    query = (
-        select(DishModel)
-        .where(DishModel.id == dish_id)
-        .options(
-            selectinload(DishModel.ingredient_instances).selectinload(
-                IngredientInstanceModel.ingredient
-            ).selectinload(IngredientModel.store)
-        )
-    )
-    result = await db.execute(query)
-    dish = result.scalar_one()
-
+    # The initial SELECT already loaded the relationships; no re-fetch needed
     return dish
 
 
@@ -218,15 +251,12 @@ async def delete_dish(
     db: AsyncSession = Depends(get_db),
 ) -> None:
     """Delete a dish."""
-    query = select(DishModel).where(DishModel.id == dish_id)
-    result = await db.execute(query)
-    dish = result.scalar_one_or_none()
+    # Single DELETE round-trip; the dish_id FKs cascade at the DB level,
+    # so no ORM load/unit-of-work pass is needed
+    result = await db.execute(delete(DishModel).where(DishModel.id == dish_id))
 
-    if not dish:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Dish with id {dish_id} not found",
         )
-
-    await db.delete(dish)
-    await db.flush()
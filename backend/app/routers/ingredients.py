@@ -1,15 +1,21 @@
 """API routes for ingredient management and parsing."""
 
+import logging
+import time
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import bindparam, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.db import get_db
+from app.db import get_db, get_db_ro
 from app.db.models import Ingredient as IngredientModel
 from app.db.models import IngredientInstance as IngredientInstanceModel
+from app.db.models import Store as StoreModel
 from app.models.ingredients import (
     IngredientCreate,
     IngredientUpdate,
@@ -24,8 +30,73 @@ from app.models.ingredients import (
 from app.services.ingredient_parser import IngredientParserService
 from app.services.unit_normalizer import unit_normalizer
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/ingredients", tags=["ingredients"])
 
+# Prebuilt single-row lookup; constructing the Select (and its loader
+# options) once at import time avoids rebuilding the expression tree on
+# every request
+_INGREDIENT_BY_ID = (
+    select(IngredientModel)
+    .options(selectinload(IngredientModel.store))
+    .where(IngredientModel.id == bindparam("id"))
+)
+
+
+# In-process cache of the {id, name, unit} projection handed to the LLM
+# parser. Invalidated by a generation bump on ingredient writes; the TTL
+# bounds staleness from writes in other workers/processes.
+_INGREDIENT_CACHE_TTL = 30.0
+_ingredient_cache: dict = {
+    "generation": 0,
+    "built_generation": -1,
+    "built_at": 0.0,
+    "data": None,
+}
+
+
+def invalidate_ingredient_cache() -> None:
+    """Mark the cached ingredient projection stale."""
+    _ingredient_cache["generation"] += 1
+
+
+async def get_existing_ingredients_cached(db: AsyncSession) -> list[dict]:
+    """Return the existing-ingredient projection, cached between writes."""
+    now = time.monotonic()
+    if (
+        _ingredient_cache["data"] is not None
+        and _ingredient_cache["built_generation"] == _ingredient_cache["generation"]
+        and now - _ingredient_cache["built_at"] < _INGREDIENT_CACHE_TTL
+    ):
+        return _ingredient_cache["data"]
+
+    result = await db.execute(
+        select(
+            IngredientModel.id, IngredientModel.name, IngredientModel.unit
+        ).order_by(IngredientModel.name)
+    )
+    # RowMappings already expose id/name/unit by key; no per-row dict
+    # rebuild or ORM hydration needed
+    data = result.mappings().all()
+    _ingredient_cache.update(
+        data=data,
+        built_at=now,
+        built_generation=_ingredient_cache["generation"],
+    )
+    return data
+
+
+@lru_cache(maxsize=1)
+def get_parser() -> IngredientParserService:
+    """Return the shared parser instance.
+
+    Constructing the service per request rebuilt the OpenAI client each
+    time; the singleton reuses its connection pool. Called inline rather
+    than via Depends so the sync factory never hits the threadpool.
+    """
+    return IngredientParserService()
+
 
 # =============================================================================
 # Ingredient CRUD Endpoints
@@ -47,49 +118,93 @@ async def create_ingredient(
     )
     db.add(db_ingredient)
     await db.flush()
-
-    # Re-fetch with store relationship loaded
-    query = (
-        select(IngredientModel)
-        .options(selectinload(IngredientModel.store))
-        .where(IngredientModel.id == db_ingredient.id)
+    invalidate_ingredient_cache()
+
+    # Populate the store relationship from the identity map (or one PK
+    # lookup) instead of re-selecting the ingredient with an eager option
+    store = (
+        await db.get(StoreModel, db_ingredient.store_id)
+        if db_ingredient.store_id is not None
+        else None
     )
-    result = await db.execute(query)
-    return result.scalar_one()
+    set_committed_value(db_ingredient, "store", store)
+    return db_ingredient
 
 
-@router.get("/", response_model=list[IngredientResponse])
+@router.get("/")
 async def list_ingredients(
-    skip: int = 0,
+    after_name: Optional[str] = None,
+    after_id: Optional[int] = None,
     limit: int = 100,
     search: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
-) -> list[IngredientResponse]:
-    """List all ingredients, optionally filtered by search term."""
-    query = select(IngredientModel).options(
-        selectinload(IngredientModel.store)
-    ).offset(skip).limit(limit)
+    db: AsyncSession = Depends(get_db_ro),
+) -> ORJSONResponse:
+    """List ingredients, optionally filtered by search term.
+
+    Pages by keyset on (name, id): pass the last row's name and id as
+    ``after_name``/``after_id`` to fetch the next page at constant cost.
+    """
+    # Column tuples instead of ORM entities: rows go straight from the
+    # driver into response dicts without identity-map or eager-load work,
+    # so peak memory is a page of dicts rather than a page of instances
+    query = select(
+        IngredientModel.id,
+        IngredientModel.name,
+        IngredientModel.store_id,
+        IngredientModel.unit,
+        IngredientModel.is_purchased,
+        IngredientModel.created_at,
+        IngredientModel.updated_at,
+        StoreModel.name.label("store_name"),
+    ).outerjoin(StoreModel, IngredientModel.store_id == StoreModel.id)
 
     if search:
-        query = query.where(IngredientModel.name.ilike(f"%{search}%"))
+        # Case-fold once in Python and match against the DB-generated
+        # normalized column rather than per-row ILIKE folding
+        query = query.where(
+            IngredientModel.name_norm.like(f"%{search.lower().strip()}%")
+        )
+    if after_name is not None and after_id is not None:
+        query = query.where(
+            tuple_(IngredientModel.name, IngredientModel.id)
+            > (after_name, after_id)
+        )
 
-    query = query.order_by(IngredientModel.name)
+    query = query.order_by(
+        IngredientModel.name, IngredientModel.id
+    ).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    # Serialize once and return a finished response instead of letting
+    # FastAPI re-validate the rows against a response_model; orjson
+    # handles the datetime columns natively
+    return ORJSONResponse(
+        [
+            {
+                "id": row.id,
+                "name": row.name,
+                "store_id": row.store_id,
+                "store": (
+                    {"id": row.store_id, "name": row.store_name}
+                    if row.store_id is not None
+                    else None
+                ),
+                "unit": row.unit,
+                "is_purchased": row.is_purchased,
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
+            }
+            for row in result
+        ]
+    )
 
 
 @router.get("/{ingredient_id}", response_model=IngredientResponse)
 async def get_ingredient(
     ingredient_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> IngredientResponse:
     """Get a specific ingredient by ID."""
-    query = (
-        select(IngredientModel)
-        .options(selectinload(IngredientModel.store))
-        .where(IngredientModel.id == ingredient_id)
-    )
-    result = await db.execute(query)
+    result = await db.execute(_INGREDIENT_BY_ID, {"id": ingredient_id})
     ingredient = result.scalar_one_or_none()
 
     if not ingredient:
@@ -107,11 +222,26 @@ async def update_ingredient(
     db: AsyncSession = Depends(get_db),
 ) -> IngredientResponse:
     """Update an ingredient."""
-    query = select(IngredientModel).options(
-        selectinload(IngredientModel.store)
-    ).where(IngredientModel.id == ingredient_id)
-    result = await db.execute(query)
-    ingredient = result.scalar_one_or_none()
+    update_data = ingredient_update.model_dump(exclude_unset=True)
+    if "unit" in update_data and update_data["unit"]:
+        update_data["unit"] = unit_normalizer.normalize(update_data["unit"])
+    if "name" in update_data and update_data["name"]:
+        update_data["name"] = update_data["name"].lower().strip()
+
+    # One UPDATE ... RETURNING replaces the SELECT-mutate-flush cycle;
+    # a missing row surfaces as an empty RETURNING set
+    if update_data:
+        stmt = (
+            update(IngredientModel)
+            .where(IngredientModel.id == ingredient_id)
+            .values(**update_data)
+            .returning(IngredientModel)
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        ingredient = result.scalar_one_or_none()
+    else:
+        ingredient = await db.get(IngredientModel, ingredient_id)
 
     if not ingredient:
         raise HTTPException(
@@ -119,22 +249,16 @@ async def update_ingredient(
             detail=f"Ingredient with id {ingredient_id} not found",
         )
 
-    update_data = ingredient_update.model_dump(exclude_unset=True)
-    if "unit" in update_data and update_data["unit"]:
-        update_data["unit"] = unit_normalizer.normalize(update_data["unit"])
-    if "name" in update_data and update_data["name"]:
-        update_data["name"] = update_data["name"].lower().strip()
-
-    for field, value in update_data.items():
-        setattr(ingredient, field, value)
+    # RETURNING does not hydrate relationships; attach the store without
+    # dirtying the instance so the response can serialize it
+    store = (
+        await db.get(StoreModel, ingredient.store_id)
+        if ingredient.store_id is not None
+        else None
+    )
+    set_committed_value(ingredient, "store", store)
 
-    await db.flush()
-    # Re-fetch with store relationship loaded
-    query = select(IngredientModel).options(
-        selectinload(IngredientModel.store)
-    ).where(IngredientModel.id == ingredient_id)
-    result = await db.execute(query)
-    ingredient = result.scalar_one()
+    invalidate_ingredient_cache()
     return ingredient
 
 
@@ -144,9 +268,7 @@ async def delete_ingredient(
     db: AsyncSession = Depends(get_db),
 ) -> None:
     """Delete an ingredient."""
-    query = select(IngredientModel).where(IngredientModel.id == ingredient_id)
-    result = await db.execute(query)
-    ingredient = result.scalar_one_or_none()
+    ingredient = await db.get(IngredientModel, ingredient_id)
 
     if not ingredient:
         raise HTTPException(
@@ -156,6 +278,7 @@ async def delete_ingredient(
 
     await db.delete(ingredient)
     await db.flush()
+    invalidate_ingredient_cache()
 
 
 
@@ -170,42 +293,35 @@ async def create_ingredient_instance(
     db: AsyncSession = Depends(get_db),
 ) -> IngredientInstanceResponse:
     """Create a new ingredient instance for a dish."""
-    db_instance = IngredientInstanceModel(
-        ingredient_id=instance.ingredient_id,
-        dish_id=instance.dish_id,
-        quantity=instance.quantity,
-        notes=instance.notes,
-    )
-    db.add(db_instance)
-    await db.flush()
-
-    # Reload with ingredient and store relationships
-    query = (
-        select(IngredientInstanceModel)
-        .where(IngredientInstanceModel.id == db_instance.id)
-        .options(
-            selectinload(IngredientInstanceModel.ingredient).selectinload(
-                IngredientModel.store
-            )
+    # INSERT ... RETURNING fuses the insert and the read-back into one
+    # round-trip; the ingredient (with its store) is attached via db.get
+    stmt = (
+        insert(IngredientInstanceModel)
+        .values(
+            ingredient_id=instance.ingredient_id,
+            dish_id=instance.dish_id,
+            quantity=instance.quantity,
+            notes=instance.notes,
         )
+        .returning(IngredientInstanceModel)
     )
-    result = await db.execute(query)
-    return result.scalar_one()
+    result = await db.execute(stmt)
+    db_instance = result.scalar_one()
+
+    ingredient = await db.get(IngredientModel, db_instance.ingredient_id)
+    set_committed_value(db_instance, "ingredient", ingredient)
+    return db_instance
 
 
 @router.get("/instances/{instance_id}", response_model=IngredientInstanceResponse)
 async def get_ingredient_instance(
     instance_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> IngredientInstanceResponse:
     """Get a specific ingredient instance."""
-    query = (
-        select(IngredientInstanceModel)
-        .where(IngredientInstanceModel.id == instance_id)
-        .options(selectinload(IngredientInstanceModel.ingredient))
-    )
-    result = await db.execute(query)
-    instance = result.scalar_one_or_none()
+    # db.get hits the identity map first; the ingredient (and its store)
+    # come along via the relationship-level joined loads
+    instance = await db.get(IngredientInstanceModel, instance_id)
 
     if not instance:
         raise HTTPException(
@@ -222,13 +338,22 @@ async def update_ingredient_instance(
     db: AsyncSession = Depends(get_db),
 ) -> IngredientInstanceResponse:
     """Update an ingredient instance."""
-    query = (
-        select(IngredientInstanceModel)
-        .where(IngredientInstanceModel.id == instance_id)
-        .options(selectinload(IngredientInstanceModel.ingredient))
-    )
-    result = await db.execute(query)
-    instance = result.scalar_one_or_none()
+    update_data = instance_update.model_dump(exclude_unset=True)
+
+    # One UPDATE ... RETURNING replaces the SELECT-mutate-flush-refresh
+    # cycle
+    if update_data:
+        stmt = (
+            update(IngredientInstanceModel)
+            .where(IngredientInstanceModel.id == instance_id)
+            .values(**update_data)
+            .returning(IngredientInstanceModel)
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        instance = result.scalar_one_or_none()
+    else:
+        instance = await db.get(IngredientInstanceModel, instance_id)
 
     if not instance:
         raise HTTPException(
@@ -236,12 +361,8 @@ async def update_ingredient_instance(
             detail=f"Ingredient instance with id {instance_id} not found",
         )
 
-    update_data = instance_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(instance, field, value)
-
-    await db.flush()
-    await db.refresh(instance)
+    ingredient = await db.get(IngredientModel, instance.ingredient_id)
+    set_committed_value(instance, "ingredient", ingredient)
     return instance
 
 
@@ -251,11 +372,7 @@ async def delete_ingredient_instance(
     db: AsyncSession = Depends(get_db),
 ) -> None:
     """Delete an ingredient instance."""
-    query = select(IngredientInstanceModel).where(
-        IngredientInstanceModel.id == instance_id
-    )
-    result = await db.execute(query)
-    instance = result.scalar_one_or_none()
+    instance = await db.get(IngredientInstanceModel, instance_id)
 
     if not instance:
         raise HTTPException(
@@ -274,7 +391,7 @@ async def delete_ingredient_instance(
 @router.post("/parse", response_model=ParseIngredientsResponse)
 async def parse_ingredients(
     request: ParseIngredientsRequest,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> ParseIngredientsResponse:
     """
     Parse natural language ingredient list into structured format.
@@ -282,27 +399,20 @@ async def parse_ingredients(
     Uses AI to extract ingredients and matches them against existing
     ingredients in the database when possible.
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
+    # Fast path: no input means no ingredients — don't touch the DB or
+    # pay for an LLM call
+    if not request.text or not request.text.strip():
+        return ParseIngredientsResponse(ingredients=[], count=0)
 
     try:
-        # Fetch existing ingredients for matching
-        logger.info("Fetching existing ingredients...")
-        query = select(IngredientModel).order_by(IngredientModel.name)
-        result = await db.execute(query)
-        existing = result.scalars().all()
-
-        existing_list = [
-            {"id": ing.id, "name": ing.name, "unit": ing.unit}
-            for ing in existing
-        ]
+        # Fetch existing ingredients for matching (cached between writes)
+        existing_list = await get_existing_ingredients_cached(db)
         logger.info(f"Found {len(existing_list)} existing ingredients")
 
         # Parse with AI
         logger.info(f"Parsing text: {request.text[:100]}...")
-        parser = IngredientParserService()
-        parsed = parser.parse(request.text, existing_list)
+        parser = get_parser()
+        parsed = await parser.parse(request.text, existing_list)
         logger.info(f"Parsed {len(parsed)} ingredients")
 
         # Convert to response format
@@ -8,7 +8,7 @@ from app.models.recipes import (
     ProcessRecipesRequest,
     ProcessRecipesResponse,
 )
-from app.services.ingredient_parser import IngredientParserService
+from app.routers.ingredients import get_parser
 
 router = APIRouter(prefix="/recipes", tags=["recipes"])
 
@@ -21,37 +21,19 @@ async def process_recipes(request: ProcessRecipesRequest) -> ProcessRecipesRespo
     Takes a list of recipes with natural language ingredient lists and
     returns structured ingredients for each dish.
     """
-    parser = IngredientParserService()
-    dishes = []
-    total_ingredients = 0
-
-    for recipe in request.recipes:
-        try:
-            result = await parser.parse(recipe.recipe_text)
-
-            ingredients = [
-                ParsedIngredientItem(
-                    name=ing.name,
-                    quantity=ing.quantity,
-                    unit=ing.unit,
-                    notes=ing.notes,
-                    existing_ingredient_id=ing.existing_ingredient_id,
-                    is_new=ing.is_new,
-                )
-                for ing in result.ingredients
-            ]
+    parser = get_parser()
 
-            dishes.append(
-                DishIngredients(
-                    dish_name=recipe.dish_name,
-                    ingredients=ingredients,
-                    count=len(ingredients),
-                )
-            )
-            total_ingredients += len(ingredients)
+    # The LLM calls run on the async client, so the batch overlaps its
+    # network latency on the event loop with no worker threads involved
+    results = await parser.parse_many(
+        [recipe.recipe_text for recipe in request.recipes]
+    )
 
-        except Exception:
-            # Log error but continue processing other recipes
+    dishes = []
+    total_ingredients = 0
+    for recipe, result in zip(request.recipes, results):
+        if isinstance(result, BaseException):
+            # Keep processing other recipes on a failed parse
             dishes.append(
                 DishIngredients(
                     dish_name=recipe.dish_name,
@@ -59,6 +41,28 @@ async def process_recipes(request: ProcessRecipesRequest) -> ProcessRecipesRespo
                     count=0,
                 )
             )
+            continue
+
+        ingredients = [
+            ParsedIngredientItem(
+                name=ing.name,
+                quantity=ing.quantity,
+                unit=ing.unit,
+                notes=ing.notes,
+                existing_ingredient_id=ing.matched_ingredient_id,
+                is_new=ing.matched_ingredient_id is None,
+            )
+            for ing in result
+        ]
+
+        dishes.append(
+            DishIngredients(
+                dish_name=recipe.dish_name,
+                ingredients=ingredients,
+                count=len(ingredients),
+            )
+        )
+        total_ingredients += len(ingredients)
 
     return ProcessRecipesResponse(
         dishes=dishes,
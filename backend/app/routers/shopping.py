@@ -1,11 +1,14 @@
 """API routes for shopping list generation."""
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import bindparam, case, exists, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.db import get_db
+from app.db import execute_one, get_db, get_db_ro
 from app.db.models import Dish as DishModel
 from app.db.models import ShoppingListItem as ShoppingListItemModel
 from app.models.dishes import CourseType, DishSummary
@@ -14,7 +17,6 @@ from app.models.shopping import (
     ShoppingItem,
     ShoppingListItemCreate,
     ShoppingListItemResponse,
-    ShoppingListItemsResponse,
     ShoppingListItemUpdate,
     ShoppingListRequest,
     ShoppingListResponse,
@@ -26,6 +28,14 @@ from app.db.models import CourseType as DBCourseType
 
 router = APIRouter(prefix="/shopping", tags=["shopping"])
 
+# Prebuilt single-row lookup shared by the GET/PUT/PATCH handlers; the
+# Select tree and loader options are constructed once at import time
+_ITEM_BY_ID = (
+    select(ShoppingListItemModel)
+    .options(selectinload(ShoppingListItemModel.dish))
+    .where(ShoppingListItemModel.id == bindparam("id"))
+)
+
 
 @router.post("/generate", response_model=ShoppingListResponse)
 async def generate_shopping_list(request: ShoppingListRequest) -> ShoppingListResponse:
@@ -78,9 +88,17 @@ async def consolidate_items(
 
 
 # Database-backed shopping list endpoints
+
+# Static mapping; a dict probe avoids the Enum.__call__ machinery on every
+# DishSummary materialization
+_COURSE_MAP: dict[DBCourseType, CourseType] = {
+    course: CourseType(course.value) for course in DBCourseType
+}
+
+
 def _db_course_to_pydantic(course: DBCourseType) -> CourseType:
     """Convert DB CourseType to Pydantic CourseType."""
-    return CourseType(course.value)
+    return _COURSE_MAP[course]
 
 
 @router.post("/items", response_model=ShoppingListItemResponse, status_code=status.HTTP_201_CREATED)
@@ -89,29 +107,37 @@ async def create_shopping_item(
     db: AsyncSession = Depends(get_db),
 ) -> ShoppingListItemResponse:
     """Create a new shopping list item."""
-    # Verify dish exists if provided
+    # Verify dish exists if provided; fetch only the summary columns
+    # instead of hydrating a full Dish instance
     dish = None
     if item.dish_id:
-        query = select(DishModel).where(DishModel.id == item.dish_id)
+        query = select(DishModel.id, DishModel.name, DishModel.course).where(
+            DishModel.id == item.dish_id
+        )
         result = await db.execute(query)
-        dish = result.scalar_one_or_none()
+        dish = result.one_or_none()
         if not dish:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Dish with id {item.dish_id} not found",
             )
 
-    db_item = ShoppingListItemModel(
-        ingredient_name=item.ingredient_name,
-        quantity=item.quantity,
-        unit=item.unit,
-        category=item.category,
-        notes=item.notes,
-        dish_id=item.dish_id,
+    # INSERT ... RETURNING gives back the full row (including defaults)
+    # in one round-trip instead of add + flush + refresh
+    stmt = (
+        insert(ShoppingListItemModel)
+        .values(
+            ingredient_name=item.ingredient_name,
+            quantity=item.quantity,
+            unit=item.unit,
+            category=item.category,
+            notes=item.notes,
+            dish_id=item.dish_id,
+        )
+        .returning(ShoppingListItemModel)
     )
-    db.add(db_item)
-    await db.flush()
-    await db.refresh(db_item)
+    result = await db.execute(stmt)
+    db_item = result.scalar_one()
 
     dish_summary = None
     if dish:
@@ -135,84 +161,109 @@ async def create_shopping_item(
     )
 
 
-@router.get("/items", response_model=ShoppingListItemsResponse)
+@router.get("/items")
 async def list_shopping_items(
-    skip: int = 0,
+    after_id: int | None = None,
     limit: int = 100,
     checked: bool | None = None,
     dish_id: int | None = None,
-    db: AsyncSession = Depends(get_db),
-) -> ShoppingListItemsResponse:
-    """List all shopping list items with optional filtering."""
-    query = select(ShoppingListItemModel).options(selectinload(ShoppingListItemModel.dish))
+    db: AsyncSession = Depends(get_db_ro),
+) -> ORJSONResponse:
+    """List all shopping list items with optional filtering.
+
+    Pages by keyset: pass the previous page's ``next_cursor`` as
+    ``after_id``. Every page costs the same regardless of depth, unlike
+    OFFSET which scans and discards the skipped rows.
+    """
+    # Column tuples instead of ORM entities: the page never exists as
+    # ORM instances, only as response dicts, and the dish summary comes
+    # from an outer join rather than a second selectin query
+    query = select(
+        ShoppingListItemModel.id,
+        ShoppingListItemModel.ingredient_name,
+        ShoppingListItemModel.quantity,
+        ShoppingListItemModel.unit,
+        ShoppingListItemModel.category,
+        ShoppingListItemModel.notes,
+        ShoppingListItemModel.is_checked,
+        ShoppingListItemModel.dish_id,
+        ShoppingListItemModel.created_at,
+        ShoppingListItemModel.updated_at,
+        DishModel.name.label("dish_name"),
+        DishModel.course.label("dish_course"),
+    ).outerjoin(DishModel, ShoppingListItemModel.dish_id == DishModel.id)
 
     if checked is not None:
         query = query.where(ShoppingListItemModel.is_checked == checked)
     if dish_id is not None:
         query = query.where(ShoppingListItemModel.dish_id == dish_id)
-
-    query = query.offset(skip).limit(limit)
-    result = await db.execute(query)
-    items = result.scalars().all()
-
-    # Get counts
-    count_query = select(func.count(ShoppingListItemModel.id))
+    if after_id is not None:
+        query = query.where(ShoppingListItemModel.id > after_id)
+
+    # Explicit ORDER BY id lets the (dish_id, is_checked, id) index feed
+    # the LIMIT without a sort node, and makes paging deterministic
+    query = query.order_by(ShoppingListItemModel.id).limit(limit)
+
+    # Total and checked counts come from one aggregate, overlapped with
+    # the page fetch on a second read session
+    count_query = select(
+        func.count(),
+        func.coalesce(
+            func.sum(case((ShoppingListItemModel.is_checked, 1), else_=0)), 0
+        ),
+    ).select_from(ShoppingListItemModel)
     if checked is not None:
         count_query = count_query.where(ShoppingListItemModel.is_checked == checked)
     if dish_id is not None:
         count_query = count_query.where(ShoppingListItemModel.dish_id == dish_id)
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
 
-    checked_query = select(func.count(ShoppingListItemModel.id)).where(
-        ShoppingListItemModel.is_checked.is_(True)
+    result, counts = await asyncio.gather(
+        db.execute(query), execute_one(count_query)
     )
-    checked_result = await db.execute(checked_query)
-    checked_count = checked_result.scalar() or 0
-
-    response_items = []
-    for item in items:
-        dish_summary = None
-        if item.dish:
-            dish_summary = DishSummary(
-                id=item.dish.id,
-                name=item.dish.name,
-                course=_db_course_to_pydantic(item.dish.course),
-            )
-        response_items.append(
-            ShoppingListItemResponse(
-                id=item.id,
-                ingredient_name=item.ingredient_name,
-                quantity=item.quantity,
-                unit=item.unit,
-                category=item.category,
-                notes=item.notes,
-                is_checked=item.is_checked,
-                dish=dish_summary,
-                created_at=item.created_at,
-                updated_at=item.updated_at,
-            )
-        )
-
-    return ShoppingListItemsResponse(
-        items=response_items,
-        total=total,
-        checked_count=checked_count,
+    total, checked_count = counts
+    items = [
+        {
+            "id": row.id,
+            "ingredient_name": row.ingredient_name,
+            "quantity": row.quantity,
+            "unit": row.unit,
+            "category": row.category,
+            "notes": row.notes,
+            "is_checked": row.is_checked,
+            "dish": (
+                {
+                    "id": row.dish_id,
+                    "name": row.dish_name,
+                    "course": _COURSE_MAP[row.dish_course].value,
+                }
+                if row.dish_id is not None
+                else None
+            ),
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+        }
+        for row in result
+    ]
+
+    # Serialize once and skip FastAPI's response_model re-validation
+    # pass; orjson handles the datetime columns natively
+    return ORJSONResponse(
+        {
+            "items": items,
+            "total": total,
+            "checked_count": checked_count,
+            "next_cursor": items[-1]["id"] if items else None,
+        }
     )
 
 
 @router.get("/items/{item_id}", response_model=ShoppingListItemResponse)
 async def get_shopping_item(
     item_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> ShoppingListItemResponse:
     """Get a specific shopping list item."""
-    query = (
-        select(ShoppingListItemModel)
-        .options(selectinload(ShoppingListItemModel.dish))
-        .where(ShoppingListItemModel.id == item_id)
-    )
-    result = await db.execute(query)
+    result = await db.execute(_ITEM_BY_ID, {"id": item_id})
     item = result.scalar_one_or_none()
 
     if not item:
@@ -250,66 +301,57 @@ async def update_shopping_item(
     db: AsyncSession = Depends(get_db),
 ) -> ShoppingListItemResponse:
     """Update a shopping list item."""
-    query = (
-        select(ShoppingListItemModel)
-        .options(selectinload(ShoppingListItemModel.dish))
-        .where(ShoppingListItemModel.id == item_id)
-    )
-    result = await db.execute(query)
-    item = result.scalar_one_or_none()
-
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Shopping item with id {item_id} not found",
-        )
+    # None means "leave unchanged" for every field, so exclude_none gives
+    # exactly the columns to write
+    update_data = item_update.model_dump(exclude_none=True)
 
     # Verify new dish exists if provided
     if item_update.dish_id is not None:
         if item_update.dish_id != 0:  # 0 means remove dish association
-            dish_query = select(DishModel).where(DishModel.id == item_update.dish_id)
-            dish_result = await db.execute(dish_query)
-            if not dish_result.scalar_one_or_none():
+            dish_exists = await db.scalar(
+                select(exists().where(DishModel.id == item_update.dish_id))
+            )
+            if not dish_exists:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Dish with id {item_update.dish_id} not found",
                 )
-            item.dish_id = item_update.dish_id
         else:
-            item.dish_id = None
-
-    # Update fields
-    if item_update.ingredient_name is not None:
-        item.ingredient_name = item_update.ingredient_name
-    if item_update.quantity is not None:
-        item.quantity = item_update.quantity
-    if item_update.unit is not None:
-        item.unit = item_update.unit
-    if item_update.category is not None:
-        item.category = item_update.category
-    if item_update.notes is not None:
-        item.notes = item_update.notes
-    if item_update.is_checked is not None:
-        item.is_checked = item_update.is_checked
-
-    await db.flush()
-    await db.refresh(item)
+            update_data["dish_id"] = None
+
+    # One UPDATE ... RETURNING replaces the SELECT-mutate-flush cycle; a
+    # missing row surfaces as an empty RETURNING set
+    if update_data:
+        stmt = (
+            update(ShoppingListItemModel)
+            .where(ShoppingListItemModel.id == item_id)
+            .values(**update_data)
+            .returning(ShoppingListItemModel)
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        item = result.scalar_one_or_none()
+    else:
+        item = await db.get(ShoppingListItemModel, item_id)
 
-    # Reload with dish relationship
-    query = (
-        select(ShoppingListItemModel)
-        .options(selectinload(ShoppingListItemModel.dish))
-        .where(ShoppingListItemModel.id == item_id)
-    )
-    result = await db.execute(query)
-    item = result.scalar_one()
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Shopping item with id {item_id} not found",
+        )
 
+    # RETURNING does not hydrate relationships; fetch just the summary
+    # columns for the response when a dish is attached
     dish_summary = None
-    if item.dish:
+    if item.dish_id is not None:
+        dish_query = select(DishModel.id, DishModel.name, DishModel.course).where(
+            DishModel.id == item.dish_id
+        )
+        dish = (await db.execute(dish_query)).one()
         dish_summary = DishSummary(
-            id=item.dish.id,
-            name=item.dish.name,
-            course=_db_course_to_pydantic(item.dish.course),
+            id=dish.id,
+            name=dish.name,
+            course=_db_course_to_pydantic(dish.course),
         )
 
     return ShoppingListItemResponse(
@@ -332,9 +374,7 @@ async def delete_shopping_item(
     db: AsyncSession = Depends(get_db),
 ) -> None:
     """Delete a shopping list item."""
-    query = select(ShoppingListItemModel).where(ShoppingListItemModel.id == item_id)
-    result = await db.execute(query)
-    item = result.scalar_one_or_none()
+    item = await db.get(ShoppingListItemModel, item_id)
 
     if not item:
         raise HTTPException(
@@ -352,12 +392,7 @@ async def toggle_shopping_item(
     db: AsyncSession = Depends(get_db),
 ) -> ShoppingListItemResponse:
     """Toggle the checked status of a shopping list item."""
-    query = (
-        select(ShoppingListItemModel)
-        .options(selectinload(ShoppingListItemModel.dish))
-        .where(ShoppingListItemModel.id == item_id)
-    )
-    result = await db.execute(query)
+    result = await db.execute(_ITEM_BY_ID, {"id": item_id})
     item = result.scalar_one_or_none()
 
     if not item:
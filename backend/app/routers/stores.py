@@ -1,10 +1,10 @@
 """API routes for store management."""
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_db, get_db_ro
 from app.db.models import Store
 from app.models import StoreCreate, StoreListResponse, StoreResponse, StoreUpdate
 
@@ -12,7 +12,7 @@ router = APIRouter(prefix="/stores", tags=["stores"])
 
 
 @router.get("", response_model=StoreListResponse)
-async def list_stores(db: AsyncSession = Depends(get_db)) -> StoreListResponse:
+async def list_stores(db: AsyncSession = Depends(get_db_ro)) -> StoreListResponse:
     """List all stores."""
     result = await db.execute(select(Store).order_by(Store.name))
     stores = result.scalars().all()
@@ -28,11 +28,12 @@ async def create_store(
     db: AsyncSession = Depends(get_db),
 ) -> StoreResponse:
     """Create a new store."""
-    # Check if store with same name exists
-    existing = await db.execute(
-        select(Store).where(Store.name.ilike(store_data.name))
+    # Check if store with same name exists; exists() returns a single
+    # bool instead of hydrating a Store row
+    duplicate = await db.scalar(
+        select(exists().where(Store.name.ilike(store_data.name)))
     )
-    if existing.scalar_one_or_none():
+    if duplicate:
         raise HTTPException(status_code=400, detail="Store with this name already exists")
 
     store = Store(name=store_data.name)
@@ -45,11 +46,10 @@ async def create_store(
 @router.get("/{store_id}", response_model=StoreResponse)
 async def get_store(
     store_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> StoreResponse:
     """Get a store by ID."""
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
+    store = await db.get(Store, store_id)
     if not store:
         raise HTTPException(status_code=404, detail="Store not found")
     return StoreResponse.model_validate(store)
@@ -62,17 +62,20 @@ async def update_store(
     db: AsyncSession = Depends(get_db),
 ) -> StoreResponse:
     """Update a store."""
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
+    store = await db.get(Store, store_id)
     if not store:
         raise HTTPException(status_code=404, detail="Store not found")
 
     if store_data.name is not None:
         # Check for duplicate name
-        existing = await db.execute(
-            select(Store).where(Store.name.ilike(store_data.name), Store.id != store_id)
+        duplicate = await db.scalar(
+            select(
+                exists().where(
+                    Store.name.ilike(store_data.name), Store.id != store_id
+                )
+            )
         )
-        if existing.scalar_one_or_none():
+        if duplicate:
             raise HTTPException(status_code=400, detail="Store with this name already exists")
         store.name = store_data.name
 
@@ -87,8 +90,7 @@ async def delete_store(
     db: AsyncSession = Depends(get_db),
 ) -> None:
     """Delete a store."""
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
+    store = await db.get(Store, store_id)
     if not store:
         raise HTTPException(status_code=404, detail="Store not found")
 
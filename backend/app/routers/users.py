@@ -1,32 +1,93 @@
 """API routes for user management and RSVP."""
 
+import asyncio
+import time
+import uuid
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import exists, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import execute_count, get_db, get_db_ro
 from app.db.models import User
 from app.models import (
     PlusOneCreate,
-    RSVPListResponse,
     RSVPResponse,
     UserCreate,
-    UserPublicResponse,
     UserResponse,
     UserUpdate,
 )
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Response fields shared by every handler. Rows coming out of the ORM are
+# already typed, so model_construct skips Pydantic validation — inbound
+# payloads (UserCreate/UserUpdate) still go through the validators.
+_USER_FIELDS = (
+    "id",
+    "first_name",
+    "last_name",
+    "original_invitee_id",
+    "has_rsvped",
+    "rsvped_at",
+    "created_at",
+)
+
+
+def validate_user_id(user_id: str) -> str:
+    """Reject ids that don't parse as UUIDs before they reach the driver.
+
+    The id columns are native UUIDs, so a malformed string no longer
+    compares unequal against a varchar — it raises a DBAPIError and
+    surfaces as a 500. A bad id means the user doesn't exist, so 404.
+    """
+    try:
+        uuid.UUID(user_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user_id
+
+
+def _user_to_response(user: User) -> UserResponse:
+    """Build a UserResponse from a trusted ORM row without validation."""
+    return UserResponse.model_construct(
+        **{field: getattr(user, field) for field in _USER_FIELDS}
+    )
+
+
+# In-process cache of the public RSVP-list payload, the read-heavy
+# endpoint behind the invite page. Invalidated by a generation bump on
+# user writes; the TTL bounds staleness from writes in other
+# workers/processes.
+_RSVP_CACHE_TTL = 15.0
+_rsvp_cache: dict = {
+    "generation": 0,
+    "built_generation": -1,
+    "built_at": 0.0,
+    "data": None,
+}
 
-@router.get("", response_model=list[UserResponse])
-async def list_users(db: AsyncSession = Depends(get_db)) -> list[UserResponse]:
+
+def invalidate_rsvp_cache() -> None:
+    """Mark the cached RSVP-list payload stale."""
+    _rsvp_cache["generation"] += 1
+
+
+@router.get("")
+async def list_users(db: AsyncSession = Depends(get_db_ro)) -> ORJSONResponse:
     """List all users."""
     result = await db.execute(select(User).order_by(User.last_name, User.first_name))
-    users = result.scalars().all()
-    return [UserResponse.model_validate(u) for u in users]
+    # Serialize straight from the rows: no per-user Pydantic model and
+    # no response_model re-validation; orjson handles the datetimes
+    return ORJSONResponse(
+        [
+            {field: getattr(u, field) for field in _USER_FIELDS}
+            for u in result.scalars()
+        ]
+    )
 
 
 @router.post("", response_model=UserResponse, status_code=201)
@@ -35,61 +96,79 @@ async def create_user(
     db: AsyncSession = Depends(get_db),
 ) -> UserResponse:
     """Create a new user."""
-    user = User(
-        first_name=user_data.first_name,
-        last_name=user_data.last_name,
-        original_invitee_id=user_data.original_invitee_id,
+    # INSERT ... RETURNING hands back the generated id and timestamps in
+    # the same round-trip; get_db commits on the way out
+    stmt = (
+        insert(User)
+        .values(
+            first_name=user_data.first_name,
+            last_name=user_data.last_name,
+            original_invitee_id=user_data.original_invitee_id,
+        )
+        .returning(User)
     )
-    db.add(user)
-    await db.commit()
-    await db.refresh(user)
-    return UserResponse.model_validate(user)
+    user = (await db.execute(stmt)).scalar_one()
+    invalidate_rsvp_cache()
+    return _user_to_response(user)
 
 
-@router.get("/rsvp-list", response_model=RSVPListResponse)
-async def get_rsvp_list(db: AsyncSession = Depends(get_db)) -> RSVPListResponse:
+@router.get("/rsvp-list")
+async def get_rsvp_list(db: AsyncSession = Depends(get_db_ro)) -> ORJSONResponse:
     """Get list of all RSVP'd users (public endpoint for invite page)."""
-    result = await db.execute(
-        select(User)
-        .where(User.has_rsvped == True)  # noqa: E712
-        .order_by(User.rsvped_at)
+    now = time.monotonic()
+    if (
+        _rsvp_cache["data"] is not None
+        and _rsvp_cache["built_generation"] == _rsvp_cache["generation"]
+        and now - _rsvp_cache["built_at"] < _RSVP_CACHE_TTL
+    ):
+        return ORJSONResponse(_rsvp_cache["data"])
+
+    # Only the public columns travel over the wire — is_plus_one is
+    # projected in SQL, so no ORM hydration — and the overall head count
+    # comes from a COUNT overlapped with the page fetch on its own
+    # session
+    result, total = await asyncio.gather(
+        db.execute(
+            select(
+                User.id,
+                User.first_name,
+                User.last_name,
+                User.has_rsvped,
+                User.rsvped_at,
+                User.original_invitee_id.isnot(None).label("is_plus_one"),
+            )
+            .where(User.has_rsvped == True)  # noqa: E712
+            .order_by(User.rsvped_at)
+        ),
+        execute_count(select(func.count()).select_from(User)),
     )
-    users = result.scalars().all()
-
-    # Get total count of all users
-    total_result = await db.execute(select(User))
-    all_users = total_result.scalars().all()
-
-    public_users = [
-        UserPublicResponse(
-            id=u.id,
-            first_name=u.first_name,
-            last_name=u.last_name,
-            has_rsvped=u.has_rsvped,
-            rsvped_at=u.rsvped_at,
-            is_plus_one=u.original_invitee_id is not None,
-        )
-        for u in users
-    ]
-
-    return RSVPListResponse(
-        users=public_users,
-        total=len(all_users),
-        total_rsvped=len(users),
+    public_users = [dict(row) for row in result.mappings()]
+
+    payload = {
+        "users": public_users,
+        "total": total,
+        "total_rsvped": len(public_users),
+    }
+    _rsvp_cache.update(
+        data=payload,
+        built_at=now,
+        built_generation=_rsvp_cache["generation"],
     )
+    return ORJSONResponse(payload)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> UserResponse:
     """Get a user by ID (used for magic link validation)."""
+    validate_user_id(user_id)
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return UserResponse.model_validate(user)
+    return _user_to_response(user)
 
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -99,19 +178,27 @@ async def update_user(
     db: AsyncSession = Depends(get_db),
 ) -> UserResponse:
     """Update a user."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    validate_user_id(user_id)
+    update_data = user_data.model_dump(exclude_none=True)
+
+    # One UPDATE ... RETURNING instead of SELECT, mutate, commit,
+    # refresh; an empty RETURNING set is the 404 case
+    if update_data:
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**update_data)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        user = (await db.execute(stmt)).scalar_one_or_none()
+    else:
+        user = await db.get(User, user_id)
+
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-
-    if user_data.first_name is not None:
-        user.first_name = user_data.first_name
-    if user_data.last_name is not None:
-        user.last_name = user_data.last_name
-
-    await db.commit()
-    await db.refresh(user)
-    return UserResponse.model_validate(user)
+    invalidate_rsvp_cache()
+    return _user_to_response(user)
 
 
 @router.post("/{user_id}/rsvp", response_model=RSVPResponse)
@@ -120,43 +207,51 @@ async def rsvp(
     db: AsyncSession = Depends(get_db),
 ) -> RSVPResponse:
     """RSVP for the event."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    validate_user_id(user_id)
+    # Fold the existence check into the UPDATE: the common first-RSVP
+    # case is one round-trip, and an empty RETURNING set means either an
+    # unknown id or an already-RSVP'd user
+    stmt = (
+        update(User)
+        .where(User.id == user_id, User.has_rsvped == False)  # noqa: E712
+        .values(has_rsvped=True, rsvped_at=datetime.now(timezone.utc))
+        .returning(User)
+    )
+    user = (await db.execute(stmt)).scalar_one_or_none()
 
-    if user.has_rsvped:
+    if user is not None:
+        invalidate_rsvp_cache()
         return RSVPResponse(
             success=True,
-            message=f"You've already RSVP'd, {user.first_name}! See you there! 🎄",
-            user=UserResponse.model_validate(user),
+            message=f"You're in, {user.first_name}! Can't wait to see you! 🎉",
+            user=_user_to_response(user),
         )
 
-    user.has_rsvped = True
-    user.rsvped_at = datetime.now(timezone.utc)
-    await db.commit()
-    await db.refresh(user)
+    user = await db.get(User, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
 
     return RSVPResponse(
         success=True,
-        message=f"You're in, {user.first_name}! Can't wait to see you! 🎉",
-        user=UserResponse.model_validate(user),
+        message=f"You've already RSVP'd, {user.first_name}! See you there! 🎄",
+        user=_user_to_response(user),
     )
 
 
 @router.get("/{user_id}/plus-one", response_model=UserResponse | None)
 async def get_plus_one(
     user_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ) -> UserResponse | None:
     """Get a user's plus one if they have one."""
+    validate_user_id(user_id)
     result = await db.execute(
         select(User).where(User.original_invitee_id == user_id)
     )
     plus_one = result.scalar_one_or_none()
     if not plus_one:
         return None
-    return UserResponse.model_validate(plus_one)
+    return _user_to_response(plus_one)
 
 
 @router.post("/{user_id}/plus-one", response_model=UserResponse, status_code=201)
@@ -166,29 +261,31 @@ async def add_plus_one(
     db: AsyncSession = Depends(get_db),
 ) -> UserResponse:
     """Add a plus one for a user."""
+    validate_user_id(user_id)
     # Verify the original invitee exists
-    result = await db.execute(select(User).where(User.id == user_id))
-    original_user = result.scalar_one_or_none()
-    if not original_user:
+    invitee_exists = await db.scalar(select(exists().where(User.id == user_id)))
+    if not invitee_exists:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Check if user already has a plus one
-    existing_plus_one = await db.execute(
-        select(User).where(User.original_invitee_id == user_id)
+    # Create the plus one (not RSVP'd yet - they must RSVP through their
+    # own invite link). The unique partial index on original_invitee_id
+    # enforces "one plus-one per invitee", so no pre-check SELECT — a
+    # duplicate surfaces as an IntegrityError even under concurrency.
+    stmt = (
+        insert(User)
+        .values(
+            first_name=plus_one_data.first_name,
+            last_name=plus_one_data.last_name,
+            original_invitee_id=user_id,
+        )
+        .returning(User)
     )
-    if existing_plus_one.scalar_one_or_none():
+    try:
+        plus_one = (await db.execute(stmt)).scalar_one()
+    except IntegrityError:
         raise HTTPException(status_code=400, detail="You already have a plus one")
-
-    # Create the plus one (not RSVP'd yet - they must RSVP through their own invite link)
-    plus_one = User(
-        first_name=plus_one_data.first_name,
-        last_name=plus_one_data.last_name,
-        original_invitee_id=user_id,
-    )
-    db.add(plus_one)
-    await db.commit()
-    await db.refresh(plus_one)
-    return UserResponse.model_validate(plus_one)
+    invalidate_rsvp_cache()
+    return _user_to_response(plus_one)
 
 
 @router.delete("/{user_id}", status_code=204)
@@ -197,11 +294,13 @@ async def delete_user(
     db: AsyncSession = Depends(get_db),
 ) -> None:
     """Delete a user."""
+    validate_user_id(user_id)
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     await db.delete(user)
-    await db.commit()
+    await db.flush()
+    invalidate_rsvp_cache()
 
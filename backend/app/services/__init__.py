@@ -1,12 +1,13 @@
 """Business logic services."""
 
-from app.services.unit_converter import UnitConverter
+from app.services.unit_converter import UnitConverter, unit_converter
 from app.services.data_validator import DataValidator, DataDefaults
 from app.services.ingredient_parser import IngredientParserService
 from app.services.shopping_list import ShoppingListService
 
 __all__ = [
     "UnitConverter",
+    "unit_converter",
     "DataValidator",
     "DataDefaults",
     "IngredientParserService",
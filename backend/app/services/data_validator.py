@@ -1,124 +1,242 @@
 """Data validation service for ingredient data."""
 
-from typing import Any
+from collections import deque
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from pydantic import BaseModel, Field
+if TYPE_CHECKING:
+    from app.models.shopping import ShoppingItem
 
 
-class DataDefaults(BaseModel):
-    """Configuration class for default values when data is missing."""
+class DataDefaults(NamedTuple):
+    """Default values used when row data is missing.
 
-    quantity: float = Field(1.0, description="Default quantity")
-    price: float = Field(0.0, description="Default price")
-    location: str = Field("Unknown", description="Default location")
-    units: str = Field("each", description="Default units")
-    ingredient: str = Field("Unknown Item", description="Default ingredient name")
+    An internal carrier, not an API boundary — the router converts from
+    its own Pydantic schema — so it stays a plain NamedTuple with no
+    validation machinery.
+    """
 
+    quantity: float = 1.0
+    price: float = 0.0
+    location: str = "Unknown"
+    units: str = "each"
+    ingredient: str = "Unknown Item"
 
-class ValidationWarning(BaseModel):
-    """A validation warning message."""
+
+class ValidationWarning(NamedTuple):
+    """A validation warning message.
+
+    A NamedTuple, not a Pydantic model: warnings are produced in bulk on
+    the row loop and never validated, so they don't need to pay for
+    model construction.
+    """
 
     row: int
     message: str
 
 
+# Retained-warning cap; past it only the count grows, so a pathological
+# input can't balloon resident memory with warning objects
+_MAX_WARNINGS = 1000
+
+
+# Accepted header spellings per logical field, in precedence order
+_FIELD_ALIASES = {
+    "ingredient": ("Ingredient", "ingredient"),
+    "location": ("Location", "location"),
+    "quantity": ("Qty", "qty", "quantity"),
+    "units": ("Units", "units"),
+    "price": ("Price", "price"),
+    "done": ("Done?", "done"),
+}
+
+
 class DataValidator:
     """Handles data validation and provides warnings for missing/invalid data."""
 
     def __init__(self, defaults: DataDefaults | None = None):
         self.defaults = defaults or DataDefaults()
-        self.warnings: list[ValidationWarning] = []
+        self.warnings: deque[ValidationWarning] = deque(maxlen=_MAX_WARNINGS)
+        self.total_warnings = 0
         self.row_count = 0
         self.skipped_rows = 0
+        self._col_map: dict[str, str | None] | None = None
+
+    def _add_warning(self, row_num: int, message: str) -> None:
+        """Record a warning, keeping at most the first _MAX_WARNINGS."""
+        self.total_warnings += 1
+        if self.total_warnings <= _MAX_WARNINGS:
+            self.warnings.append(ValidationWarning(row_num, message))
+
+    def prepare(self, headers) -> None:
+        """Resolve header aliases once for a whole input.
+
+        Rows share one header set, so the alias probing happens here
+        instead of as chained dict gets on every field of every row.
+        """
+        self._col_map = {
+            field: next((alias for alias in aliases if alias in headers), None)
+            for field, aliases in _FIELD_ALIASES.items()
+        }
 
     def validate_row(self, row: dict[str, str], row_num: int) -> dict[str, Any] | None:
         """Validate and clean a single row of data."""
+        # Bind the per-row constants once; attribute loads inside the
+        # field checks add up when this runs for every row of a batch
         self.row_count += 1
+        defaults = self.defaults
+        add_warning = self._add_warning
+        col_map = self._col_map
+        if col_map is None:
+            self.prepare(row.keys())
+            col_map = self._col_map
         cleaned_row = {}
         has_critical_missing = False
 
         # Validate ingredient (critical field)
-        ingredient = row.get("Ingredient", row.get("ingredient", "")).strip()
+        key = col_map["ingredient"]
+        ingredient = (row.get(key, "") if key else "").strip()
         if not ingredient:
-            self.warnings.append(ValidationWarning(row=row_num, message="Missing ingredient name"))
-            ingredient = self.defaults.ingredient
+            add_warning(row_num, "Missing ingredient name")
+            ingredient = defaults.ingredient
             has_critical_missing = True
         cleaned_row["ingredient"] = ingredient
 
         # Validate location
-        location = row.get("Location", row.get("location", "")).strip()
+        key = col_map["location"]
+        location = (row.get(key, "") if key else "").strip()
         if not location:
-            self.warnings.append(
-                ValidationWarning(row=row_num, message=f"Missing location, using '{self.defaults.location}'")
-            )
-            location = self.defaults.location
+            add_warning(row_num, f"Missing location, using '{defaults.location}'")
+            location = defaults.location
         cleaned_row["location"] = location
 
-        # Validate quantity
-        qty_str = str(row.get("Qty", row.get("qty", row.get("quantity", "")))).strip()
-        try:
-            quantity = float(qty_str) if qty_str else self.defaults.quantity
+        # Validate quantity; typed inputs (API payloads) skip the
+        # string round-trip entirely
+        key = col_map["quantity"]
+        raw_qty = row.get(key, "") if key else ""
+        if isinstance(raw_qty, (int, float)) and not isinstance(raw_qty, bool):
+            quantity = float(raw_qty)
             if quantity < 0:
-                self.warnings.append(
-                    ValidationWarning(row=row_num, message=f"Negative quantity ({quantity}), using default")
+                add_warning(row_num, f"Negative quantity ({quantity}), using default")
+                quantity = defaults.quantity
+        else:
+            qty_str = str(raw_qty).strip()
+            try:
+                quantity = float(qty_str) if qty_str else defaults.quantity
+                if quantity < 0:
+                    add_warning(row_num, f"Negative quantity ({quantity}), using default")
+                    quantity = defaults.quantity
+            except ValueError:
+                add_warning(
+                    row_num, f"Invalid quantity '{qty_str}', using default ({defaults.quantity})"
                 )
-                quantity = self.defaults.quantity
-        except ValueError:
-            self.warnings.append(
-                ValidationWarning(
-                    row=row_num, message=f"Invalid quantity '{qty_str}', using default ({self.defaults.quantity})"
-                )
-            )
-            quantity = self.defaults.quantity
+                quantity = defaults.quantity
         cleaned_row["quantity"] = quantity
 
         # Validate units
-        units = row.get("Units", row.get("units", "")).strip()
+        key = col_map["units"]
+        units = (row.get(key, "") if key else "").strip()
         if not units:
-            self.warnings.append(
-                ValidationWarning(row=row_num, message=f"Missing units, using '{self.defaults.units}'")
-            )
-            units = self.defaults.units
+            add_warning(row_num, f"Missing units, using '{defaults.units}'")
+            units = defaults.units
         cleaned_row["units"] = units
 
-        # Validate price
-        price_str = str(row.get("Price", row.get("price", ""))).strip()
-        try:
-            price = float(price_str) if price_str else self.defaults.price
+        # Validate price; same typed fast path as quantity
+        key = col_map["price"]
+        raw_price = row.get(key, "") if key else ""
+        if isinstance(raw_price, (int, float)) and not isinstance(raw_price, bool):
+            price = float(raw_price)
             if price < 0:
-                self.warnings.append(
-                    ValidationWarning(row=row_num, message=f"Negative price ({price}), using default")
-                )
-                price = self.defaults.price
-        except ValueError:
-            self.warnings.append(
-                ValidationWarning(
-                    row=row_num, message=f"Invalid price '{price_str}', using default ({self.defaults.price})"
+                add_warning(row_num, f"Negative price ({price}), using default")
+                price = defaults.price
+        else:
+            price_str = str(raw_price).strip()
+            try:
+                price = float(price_str) if price_str else defaults.price
+                if price < 0:
+                    add_warning(row_num, f"Negative price ({price}), using default")
+                    price = defaults.price
+            except ValueError:
+                add_warning(
+                    row_num, f"Invalid price '{price_str}', using default ({defaults.price})"
                 )
-            )
-            price = self.defaults.price
+                price = defaults.price
         cleaned_row["price"] = price
 
-        # Check "Done?" field
-        done = str(row.get("Done?", row.get("done", ""))).strip().lower()
-        cleaned_row["done"] = done in ("1", "true", "yes")
+        # Check "Done?" field; booleans pass straight through
+        key = col_map["done"]
+        raw_done = row.get(key, "") if key else ""
+        if isinstance(raw_done, bool):
+            cleaned_row["done"] = raw_done
+        else:
+            cleaned_row["done"] = str(raw_done).strip().lower() in ("1", "true", "yes")
 
         # Skip rows with critical missing data
-        if has_critical_missing and ingredient == self.defaults.ingredient:
-            self.warnings.append(
-                ValidationWarning(row=row_num, message="Skipping row due to missing critical data")
-            )
+        if has_critical_missing and ingredient == defaults.ingredient:
+            add_warning(row_num, "Skipping row due to missing critical data")
             self.skipped_rows += 1
             return None
 
         return cleaned_row
 
+    def validate_item(self, item: "ShoppingItem", row_num: int) -> dict[str, Any] | None:
+        """Validate a typed ShoppingItem without the row-dict detour.
+
+        The attributes are read directly and are already the right
+        types, so only the checks that can actually fail for typed input
+        remain: blank strings and negative numbers.
+        """
+        self.row_count += 1
+        defaults = self.defaults
+        add_warning = self._add_warning
+        has_critical_missing = False
+
+        ingredient = item.ingredient.strip()
+        if not ingredient:
+            add_warning(row_num, "Missing ingredient name")
+            ingredient = defaults.ingredient
+            has_critical_missing = True
+
+        location = item.location.strip()
+        if not location:
+            add_warning(row_num, f"Missing location, using '{defaults.location}'")
+            location = defaults.location
+
+        quantity = item.quantity
+        if quantity < 0:
+            add_warning(row_num, f"Negative quantity ({quantity}), using default")
+            quantity = defaults.quantity
+
+        units = item.units.strip()
+        if not units:
+            add_warning(row_num, f"Missing units, using '{defaults.units}'")
+            units = defaults.units
+
+        price = item.price
+        if price < 0:
+            add_warning(row_num, f"Negative price ({price}), using default")
+            price = defaults.price
+
+        if has_critical_missing:
+            add_warning(row_num, "Skipping row due to missing critical data")
+            self.skipped_rows += 1
+            return None
+
+        return {
+            "ingredient": ingredient,
+            "location": location,
+            "quantity": quantity,
+            "units": units,
+            "price": price,
+            "done": item.done,
+        }
+
     def get_summary(self) -> dict[str, Any]:
         """Get a summary of data validation results."""
         return {
             "total_rows_processed": self.row_count,
             "rows_skipped": self.skipped_rows,
-            "warnings_count": len(self.warnings),
-            "warnings": [w.model_dump() for w in self.warnings],
+            "warnings_count": self.total_warnings,
+            "warnings_shown": len(self.warnings),
+            "warnings": [w._asdict() for w in self.warnings],
         }
 
@@ -1,13 +1,15 @@
 """Ingredient parsing service using LLM."""
 
+import asyncio
+from functools import lru_cache
 from typing import Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
 
 from app.core.config import settings
 from app.services.unit_normalizer import unit_normalizer
-from app.services.unit_converter import UnitConverter
+from app.services.unit_converter import unit_converter
 
 
 class LLMParsedIngredient(BaseModel):
@@ -35,20 +37,7 @@ class LLMParsedIngredientList(BaseModel):
     ingredients: list[LLMParsedIngredient]
 
 
-class IngredientParserService:
-    """Service for parsing natural language ingredients using LLM."""
-
-    def __init__(self):
-        self.client = OpenAI(
-            
-            api_key=settings.openai_api_key,
-        )
-
-    def _build_system_prompt(
-        self, existing_ingredients: Optional[list[dict]] = None
-    ) -> str:
-        """Build the system prompt, optionally including existing ingredients."""
-        base_prompt = """You are an expert at parsing cooking ingredient lists.
+_BASE_SYSTEM_PROMPT = """You are an expert at parsing cooking ingredient lists.
 Extract ingredients from the user's input and structure them properly.
 
 For each ingredient, determine:
@@ -71,21 +60,49 @@ When you find an ingredient that matches one from the existing list, set \
 matched_ingredient_id to that ingredient's ID. Only match if the normalized name \
 is essentially the same ingredient."""
 
-        if existing_ingredients:
-            ingredient_list = "\n".join(
-                f"- ID {ing['id']}: {ing['name']} (unit: {ing['unit']})"
-                for ing in existing_ingredients
-            )
-            base_prompt += f"""
+
+@lru_cache(maxsize=8)
+def _render_system_prompt(ingredient_key: tuple[tuple[int, str, str], ...]) -> str:
+    """Render the full system prompt for one ingredient catalog.
+
+    The catalog changes rarely relative to parse calls (the router caches
+    its projection between writes), so the joined prompt string is cached
+    on the catalog contents instead of rebuilt per call.
+    """
+    if not ingredient_key:
+        return _BASE_SYSTEM_PROMPT
+
+    ingredient_list = "\n".join(
+        f"- ID {id_}: {name} (unit: {unit})" for id_, name, unit in ingredient_key
+    )
+    return f"""{_BASE_SYSTEM_PROMPT}
 
 EXISTING INGREDIENTS IN DATABASE:
 {ingredient_list}
 
 Match to existing ingredients when the normalized name refers to the same ingredient."""
 
-        return base_prompt
 
-    def parse(
+class IngredientParserService:
+    """Service for parsing natural language ingredients using LLM."""
+
+    def __init__(self):
+        self.client = AsyncOpenAI(
+            
+            api_key=settings.openai_api_key,
+        )
+
+    def _build_system_prompt(
+        self, existing_ingredients: Optional[list[dict]] = None
+    ) -> str:
+        """Build the system prompt, optionally including existing ingredients."""
+        key = tuple(
+            (ing["id"], ing["name"], ing["unit"])
+            for ing in existing_ingredients or ()
+        )
+        return _render_system_prompt(key)
+
+    async def parse(
         self,
         natural_language_input: str,
         existing_ingredients: Optional[list[dict]] = None,
@@ -105,7 +122,7 @@ Match to existing ingredients when the normalized name refers to the same ingred
         """
         system_prompt = self._build_system_prompt(existing_ingredients)
 
-        completion = self.client.beta.chat.completions.parse(
+        completion = await self.client.beta.chat.completions.parse(
             model=settings.openai_model,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -121,8 +138,7 @@ Match to existing ingredients when the normalized name refers to the same ingred
         if existing_ingredients:
             existing_by_id = {ing["id"]: ing for ing in existing_ingredients}
 
-        # Initialize unit converter
-        converter = UnitConverter()
+        converter = unit_converter
 
         # Normalize units and convert quantities for matched ingredients
         normalized = []
@@ -162,3 +178,19 @@ Match to existing ingredients when the normalized name refers to the same ingred
             )
 
         return normalized
+
+    async def parse_many(
+        self,
+        inputs: list[str],
+        existing_ingredients: Optional[list[dict]] = None,
+    ) -> list[list[LLMParsedIngredient] | BaseException]:
+        """Parse several inputs concurrently.
+
+        The LLM round-trips overlap instead of queueing; a failed parse
+        comes back as its exception so one bad input doesn't sink the
+        batch.
+        """
+        return await asyncio.gather(
+            *(self.parse(text, existing_ingredients) for text in inputs),
+            return_exceptions=True,
+        )
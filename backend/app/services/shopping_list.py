@@ -5,7 +5,7 @@ from typing import Any
 
 from app.models.shopping import ConsolidatedItem, ShoppingItem
 from app.services.data_validator import DataDefaults, DataValidator
-from app.services.unit_converter import UnitConverter
+from app.services.unit_converter import unit_converter
 
 
 class ShoppingListService:
@@ -19,47 +19,61 @@ class ShoppingListService:
         self.defaults = defaults or DataDefaults()
         self.enable_unit_conversion = enable_unit_conversion
         self.validator = DataValidator(self.defaults)
-        self.converter = UnitConverter() if enable_unit_conversion else None
+        self.converter = unit_converter if enable_unit_conversion else None
         self.conversion_summary: list[str] = []
 
     def generate(self, items: list[ShoppingItem]) -> list[ConsolidatedItem]:
         """Generate consolidated shopping list from ingredient items."""
-        # Convert items to row format for validation
-        raw_items = []
-        for i, item in enumerate(items, start=1):
-            row = {
-                "ingredient": item.ingredient,
-                "quantity": item.quantity,
-                "units": item.units,
-                "location": item.location,
-                "price": item.price,
-                "done": str(item.done).lower(),
-            }
-            cleaned = self.validator.validate_row(row, i)
-            if cleaned is not None and not cleaned["done"]:
-                raw_items.append(cleaned)
-
-        # Group by location and ingredient
-        ingredient_groups: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
-        for item in raw_items:
-            key = (item["location"], item["ingredient"])
-            ingredient_groups[key].append(item)
-
-        # Process each group with unit conversion
+        # Items are already typed, so they validate attribute-by-attribute
+        # with no intermediate row dicts
+        validate_item = self.validator.validate_item
         totals: dict[tuple[str, str, str], dict[str, float]] = {}
         self.conversion_summary = []
 
-        for (location, ingredient), group_items in ingredient_groups.items():
-            if not self.enable_unit_conversion or len(group_items) == 1:
-                self._aggregate_without_conversion(totals, group_items, location, ingredient)
-            else:
-                self._aggregate_with_conversion(totals, group_items, location, ingredient)
+        if not self.enable_unit_conversion:
+            # No conversion means no cross-unit grouping decisions, so
+            # totals accumulate in the same pass as validation — no
+            # intermediate item lists or group dicts
+            totals_get = totals.get
+            for row_num, item in enumerate(items, start=1):
+                cleaned = validate_item(item, row_num)
+                if cleaned is None or cleaned["done"]:
+                    continue
+                key = (cleaned["location"], cleaned["ingredient"], cleaned["units"])
+                bucket = totals_get(key)
+                if bucket is None:
+                    totals[key] = {
+                        "quantity": cleaned["quantity"],
+                        "price": cleaned["price"],
+                    }
+                else:
+                    bucket["quantity"] += cleaned["quantity"]
+                    bucket["price"] += cleaned["price"]
+        else:
+            # Conversion needs whole groups in hand to pick a common
+            # unit, so group first and convert per group
+            ingredient_groups: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+            for row_num, item in enumerate(items, start=1):
+                cleaned = validate_item(item, row_num)
+                if cleaned is None or cleaned["done"]:
+                    continue
+                ingredient_groups[(cleaned["location"], cleaned["ingredient"])].append(cleaned)
+
+            for (location, ingredient), group_items in ingredient_groups.items():
+                if len(group_items) == 1:
+                    self._aggregate_without_conversion(totals, group_items, location, ingredient)
+                else:
+                    self._aggregate_with_conversion(totals, group_items, location, ingredient)
 
-        # Convert to response format
+        # Convert to response format. The totals were computed right
+        # here, so model_construct skips re-validating them; sorting the
+        # key tuples avoids copying the value dicts through items()
         result = []
-        for (loc, ing, unit), vals in sorted(totals.items()):
+        for key in sorted(totals):
+            loc, ing, unit = key
+            vals = totals[key]
             result.append(
-                ConsolidatedItem(
+                ConsolidatedItem.model_construct(
                     location=loc,
                     ingredient=ing,
                     quantity=vals["quantity"],
@@ -80,10 +94,15 @@ class ShoppingListService:
         """Aggregate items without unit conversion."""
         for item in items:
             key = (location, ingredient, item["units"])
-            if key not in totals:
-                totals[key] = {"quantity": 0.0, "price": 0.0}
-            totals[key]["quantity"] += item["quantity"]
-            totals[key]["price"] += item["price"]
+            bucket = totals.get(key)
+            if bucket is None:
+                totals[key] = {
+                    "quantity": item["quantity"],
+                    "price": item["price"],
+                }
+            else:
+                bucket["quantity"] += item["quantity"]
+                bucket["price"] += item["price"]
 
     def _aggregate_with_conversion(
         self,
@@ -94,6 +113,23 @@ class ShoppingListService:
     ) -> None:
         """Aggregate items with unit conversion."""
         units_in_group = [item["units"] for item in items]
+        normalized_units = {
+            self.converter.normalize_unit_name(u) for u in units_in_group
+        }
+        if len(normalized_units) == 1:
+            # One unit across the group — the overwhelmingly common case
+            # — means nothing to convert. Compare and emit the normalized
+            # form so the fast path stays output-equivalent to the
+            # converter ("cups" rows still total under "cup").
+            key = (location, ingredient, next(iter(normalized_units)))
+            bucket = totals.get(key)
+            if bucket is None:
+                bucket = totals[key] = {"quantity": 0.0, "price": 0.0}
+            for item in items:
+                bucket["quantity"] += item["quantity"]
+                bucket["price"] += item["price"]
+            return
+
         best_unit = self.converter.find_best_common_unit(units_in_group)
 
         convertible_items = []
@@ -113,12 +149,10 @@ class ShoppingListService:
                 location, ingredient, best_unit,
             )
 
-        for item in non_convertible_items:
-            key = (location, ingredient, item["units"])
-            if key not in totals:
-                totals[key] = {"quantity": 0.0, "price": 0.0}
-            totals[key]["quantity"] += item["quantity"]
-            totals[key]["price"] += item["price"]
+        if non_convertible_items:
+            self._aggregate_without_conversion(
+                totals, non_convertible_items, location, ingredient
+            )
 
     def _process_convertible_items(
         self,
@@ -165,7 +199,7 @@ class ShoppingListService:
 
     def get_warnings(self) -> list[dict[str, Any]]:
         """Get validation warnings."""
-        return [w.model_dump() for w in self.validator.warnings]
+        return [w._asdict() for w in self.validator.warnings]
 
     def get_conversions(self) -> list[str]:
         """Get list of unit conversions applied."""
@@ -1,26 +1,51 @@
 """Unit conversion service for cooking ingredients."""
 
+from functools import lru_cache
 from typing import Optional
 
 import pint
 
+# Unit-name aliases, built once instead of per normalize call
+_UNIT_NAME_MAPPINGS = {
+    "lb": "pound", "lbs": "pound", "pounds": "pound",
+    "oz": "ounce", "ounces": "ounce",
+    "c": "cup", "cups": "cup",
+    "tbsp": "tablespoon", "tablespoons": "tablespoon", "tbs": "tablespoon",
+    "tsp": "teaspoon", "teaspoons": "teaspoon", "ts": "teaspoon",
+    "fl oz": "fluid_ounce", "fluid oz": "fluid_ounce", "fl_oz": "fluid_ounce",
+    "g": "gram", "grams": "gram",
+    "kg": "kilogram", "kilograms": "kilogram",
+}
+
+
+@lru_cache(maxsize=1)
+def _build_registry() -> pint.UnitRegistry:
+    """Build the shared, configured unit registry.
+
+    UnitRegistry construction parses pint's full definition file and
+    dominates the cost of creating a UnitConverter; every converter
+    instance shares this one.
+    """
+    ureg = pint.UnitRegistry()
+    # Define common cooking unit aliases
+    ureg.define("each = 1 * dimensionless")
+    ureg.define("clove = 1 * dimensionless")
+    ureg.define("head = 1 * dimensionless")
+    ureg.define("bunch = 1 * dimensionless")
+    ureg.define("package = 1 * dimensionless")
+    ureg.define("container = 1 * dimensionless")
+    ureg.define("bottle = 1 * dimensionless")
+    ureg.define("loaf = 1 * dimensionless")
+    # Define stick of butter as 4 oz (standard US measurement)
+    ureg.define("stick = 4 * ounce")
+    return ureg
+
 
 class UnitConverter:
     """Handles unit conversions for cooking ingredients."""
 
     def __init__(self):
-        self.ureg = pint.UnitRegistry()
-        # Define common cooking unit aliases
-        self.ureg.define("each = 1 * dimensionless")
-        self.ureg.define("clove = 1 * dimensionless")
-        self.ureg.define("head = 1 * dimensionless")
-        self.ureg.define("bunch = 1 * dimensionless")
-        self.ureg.define("package = 1 * dimensionless")
-        self.ureg.define("container = 1 * dimensionless")
-        self.ureg.define("bottle = 1 * dimensionless")
-        self.ureg.define("loaf = 1 * dimensionless")
-        # Define stick of butter as 4 oz (standard US measurement)
-        self.ureg.define("stick = 4 * ounce")
+        self.ureg = _build_registry()
 
         # Define preferred units for different categories
         self.preferred_units = {
@@ -55,20 +80,9 @@ class UnitConverter:
     def normalize_unit_name(self, unit_str: str) -> str:
         """Normalize unit names to standard forms."""
         unit_str = unit_str.lower().strip()
+        return _UNIT_NAME_MAPPINGS.get(unit_str, unit_str)
 
-        unit_mappings = {
-            "lb": "pound", "lbs": "pound", "pounds": "pound",
-            "oz": "ounce", "ounces": "ounce",
-            "c": "cup", "cups": "cup",
-            "tbsp": "tablespoon", "tablespoons": "tablespoon", "tbs": "tablespoon",
-            "tsp": "teaspoon", "teaspoons": "teaspoon", "ts": "teaspoon",
-            "fl oz": "fluid_ounce", "fluid oz": "fluid_ounce", "fl_oz": "fluid_ounce",
-            "g": "gram", "grams": "gram",
-            "kg": "kilogram", "kilograms": "kilogram",
-        }
-
-        return unit_mappings.get(unit_str, unit_str)
-
+    @lru_cache(maxsize=256)
     def get_unit_category(self, unit_str: str) -> str:
         """Determine the category of a unit (volume, weight, count)."""
         normalized = self.normalize_unit_name(unit_str)
@@ -79,6 +93,7 @@ class UnitConverter:
 
         return "count"
 
+    @lru_cache(maxsize=4096)
     def can_convert(self, from_unit: str, to_unit: str, ingredient: str | None = None) -> bool:
         """Check if two units can be converted between each other."""
         try:
@@ -113,38 +128,49 @@ class UnitConverter:
         ingredient: str | None = None,
     ) -> Optional[float]:
         """Convert quantity from one unit to another."""
-        try:
-            from_normalized = self.normalize_unit_name(from_unit)
-            to_normalized = self.normalize_unit_name(to_unit)
-
-            # Same unit, no conversion needed
-            if from_normalized == to_normalized:
-                return quantity
+        from_normalized = self.normalize_unit_name(from_unit)
+        to_normalized = self.normalize_unit_name(to_unit)
 
-            # Try ingredient-specific conversion (volume <-> weight)
-            ing_result = self._try_ingredient_conversion(
-                quantity, from_normalized, to_normalized, ingredient.lower() if ingredient else ""
-            )
-            if ing_result is not None:
-                return ing_result
+        # Same unit, no conversion needed
+        if from_normalized == to_normalized:
+            return quantity
 
-            # Standard unit conversion using pint
-            from_qty = self.ureg.Quantity(quantity, from_normalized)
-            to_qty = from_qty.to(to_normalized)
-            result = float(to_qty.magnitude)
+        factor = self._get_conversion_factor(
+            from_normalized, to_normalized, ingredient.lower() if ingredient else ""
+        )
+        if factor is None:
+            return None
+        return self._round_result(quantity * factor)
 
-            return self._round_result(result)
+    @lru_cache(maxsize=4096)
+    def _get_conversion_factor(
+        self, from_unit: str, to_unit: str, ingredient: str
+    ) -> Optional[float]:
+        """Multiplier that takes from_unit to to_unit, or None.
+
+        Cooking units all convert linearly, so the factor for a quantity
+        of 1 covers every quantity — the per-item hot path reduces to a
+        multiply while the dimensional analysis is paid once per unit
+        pair.
+        """
+        # Try ingredient-specific conversion (volume <-> weight)
+        ing_factor = self._ingredient_factor(from_unit, to_unit, ingredient)
+        if ing_factor is not None:
+            return ing_factor
+
+        # Standard unit conversion using pint
+        try:
+            return float(self.ureg.Quantity(1.0, from_unit).to(to_unit).magnitude)
         except Exception:
             return None
 
-    def _try_ingredient_conversion(
+    def _ingredient_factor(
         self,
-        quantity: float,
         from_unit: str,
         to_unit: str,
         ingredient: str,
     ) -> Optional[float]:
-        """Try ingredient-specific volume-weight conversions."""
+        """Per-unit factor for ingredient-specific volume-weight conversions."""
         for ing_key, conversion_data in self.ingredient_conversions.items():
             if ing_key in ingredient:
                 try:
@@ -154,37 +180,44 @@ class UnitConverter:
 
                     if from_category == "volume" and to_category == "weight":
                         # Convert source to cups first
-                        cups = self.ureg.Quantity(quantity, from_unit).to("cup").magnitude
+                        cups = self.ureg.Quantity(1.0, from_unit).to("cup").magnitude
                         ounces = cups * conversion_data["density_factor"]
-                        result = self.ureg.Quantity(ounces, "ounce").to(to_unit).magnitude
-                        return self._round_result(result)
+                        return self.ureg.Quantity(ounces, "ounce").to(to_unit).magnitude
                     elif from_category == "weight" and to_category == "volume":
                         # Convert source to ounces first
-                        ounces = self.ureg.Quantity(quantity, from_unit).to("ounce").magnitude
+                        ounces = self.ureg.Quantity(1.0, from_unit).to("ounce").magnitude
                         cups = ounces / conversion_data["density_factor"]
-                        result = self.ureg.Quantity(cups, "cup").to(to_unit).magnitude
-                        return self._round_result(result)
+                        return self.ureg.Quantity(cups, "cup").to(to_unit).magnitude
                 except Exception:
                     pass
         return None
 
     def _round_result(self, result: float) -> float:
         """Round result to appropriate precision."""
-        if result < 0.01:
-            return round(result, 4)
-        elif result < 0.1:
-            return round(result, 3)
-        elif result < 1:
-            return round(result, 2)
-        else:
+        # Everything from 0.1 up rounds to 2 places (the 0.1-1 and >=1
+        # legs were identical), so the descending chain needs 3 branches
+        if result >= 0.1:
             return round(result, 2)
+        if result >= 0.01:
+            return round(result, 3)
+        return round(result, 4)
 
     def find_best_common_unit(self, units_list: list[str]) -> str:
         """Find the best common unit for a list of units."""
         if not units_list:
             return "each"
 
-        unique_units = list(set(self.normalize_unit_name(u) for u in units_list))
+        best = self._best_common_unit(frozenset(units_list))
+        return best if best is not None else units_list[0]
+
+    @lru_cache(maxsize=1024)
+    def _best_common_unit(self, units_key: frozenset) -> Optional[str]:
+        """Common unit for an unordered set of units, or None if mixed.
+
+        Keyed on the set so every group with the same units reuses one
+        answer regardless of item order.
+        """
+        unique_units = list(set(self.normalize_unit_name(u) for u in units_key))
         if len(unique_units) == 1:
             return unique_units[0]
 
@@ -193,5 +226,9 @@ class UnitConverter:
         if all(self.get_unit_category(u) == first_category for u in unique_units):
             return self.output_preferences.get(first_category, unique_units[0])
 
-        return units_list[0]
+        return None
+
 
+# Singleton instance: the converter is stateless after construction, and
+# sharing it lets the conversion caches accumulate across requests
+unit_converter = UnitConverter()
@@ -1,5 +1,6 @@
 """Unit normalization service for consistent ingredient measurements."""
 
+from functools import lru_cache
 from typing import Optional
 
 
@@ -83,37 +84,46 @@ UNIT_ALIASES: dict[str, str] = {
 # Canonical units list (the normalized forms)
 CANONICAL_UNITS = sorted(set(UNIT_ALIASES.values()))
 
+# Merged lookup table: canonical forms map to themselves, so normalize is a
+# single dict get instead of an alias lookup plus a canonical-list scan
+_NORMALIZE: dict[str, str] = {**{unit: unit for unit in CANONICAL_UNITS}, **UNIT_ALIASES}
+
+
+@lru_cache(maxsize=512)
+def _normalize_cached(unit: str) -> str:
+    """Resolve a non-empty unit string, caching the lower/strip/lookup."""
+    unit_lower = unit.lower().strip()
+    return _NORMALIZE.get(unit_lower, unit_lower) if unit_lower else "each"
+
+
+def normalize_unit(unit: Optional[str]) -> str:
+    """
+    Normalize a unit string to its canonical form.
+
+    The same alias spellings recur across every row of a recipe or
+    shopping list, so resolutions are memoized per raw input string.
+
+    Args:
+        unit: The unit string to normalize (e.g., "tbsp", "lbs", "ozs")
+
+    Returns:
+        The canonical unit form (e.g., "tablespoon", "pound", "ounce")
+        Returns "each" for None/empty; unrecognized units pass through
+        unchanged (preserves custom units)
+    """
+    if not unit:
+        return "each"
+    return _normalize_cached(unit)
+
 
 class UnitNormalizer:
-    """Service for normalizing ingredient units."""
+    """Service for normalizing ingredient units.
 
-    @staticmethod
-    def normalize(unit: Optional[str]) -> str:
-        """
-        Normalize a unit string to its canonical form.
-        
-        Args:
-            unit: The unit string to normalize (e.g., "tbsp", "lbs", "ozs")
-            
-        Returns:
-            The canonical unit form (e.g., "tablespoon", "pound", "ounce")
-            Returns "each" for None or unrecognized units
-        """
-        if not unit:
-            return "each"
-        
-        unit_lower = unit.lower().strip()
-        
-        # Direct lookup
-        if unit_lower in UNIT_ALIASES:
-            return UNIT_ALIASES[unit_lower]
-        
-        # Check if it's already a canonical unit
-        if unit_lower in CANONICAL_UNITS:
-            return unit_lower
-        
-        # Return as-is if not recognized (preserves custom units)
-        return unit_lower if unit_lower else "each"
+    Thin shim over :func:`normalize_unit` kept for existing call sites;
+    new code can import the function directly.
+    """
+
+    normalize = staticmethod(normalize_unit)
 
     @staticmethod
     def get_canonical_units() -> list[str]:
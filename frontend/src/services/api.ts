@@ -57,7 +57,11 @@ export const api = {
     limit?: number;
     course?: CourseType;
   }): Promise<DishListResponse> => {
-    const response = await apiClient.get<DishListResponse>('/dishes/', { params });
+    // DishListResponse promises ingredient_instances, so always ask the
+    // backend for the full payload (summaries are the server default)
+    const response = await apiClient.get<DishListResponse>('/dishes/', {
+      params: { ...params, include: 'ingredients' },
+    });
     return response.data;
   },
 
@@ -1,36 +1,73 @@
 #!/usr/bin/env python3
 import csv
 import argparse
+import re
 from collections import defaultdict
+from dataclasses import dataclass
+from sys import intern
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
 import pint
+from pint.errors import DimensionalityError, UndefinedUnitError
+
+# Unit-name aliases, built once at import instead of per normalize call
+_UNIT_MAPPINGS = {
+    'lb': 'pound', 'lbs': 'pound', 'pounds': 'pound',
+    'oz': 'ounce', 'ounces': 'ounce',
+    'c': 'cup', 'cups': 'cup',
+    'tbsp': 'tablespoon', 'tablespoons': 'tablespoon', 'tbs': 'tablespoon',
+    'tsp': 'teaspoon', 'teaspoons': 'teaspoon', 'ts': 'teaspoon',
+    'fl oz': 'fluid_ounce', 'fluid oz': 'fluid_ounce', 'fl_oz': 'fluid_ounce',
+    'g': 'gram', 'grams': 'gram',
+    'kg': 'kilogram', 'kilograms': 'kilogram',
+}
+
+_PREFERRED_UNITS = {
+    # Volume units - prefer cups for cooking
+    'volume': ['cup', 'cups', 'tablespoon', 'tablespoons', 'teaspoon', 'teaspoons', 'fluid_ounce', 'fluid_ounces'],
+    # Weight units - prefer pounds for shopping
+    'weight': ['pound', 'pounds', 'ounce', 'ounces', 'gram', 'grams', 'kilogram', 'kilograms', 'stick'],
+    # Count units - keep as-is
+    'count': ['each', 'clove', 'head', 'bunch', 'package', 'container', 'bottle', 'loaf']
+}
+
+# Flat unit -> category lookup so categorizing is a single dict get
+_UNIT_TO_CATEGORY = {
+    unit: category
+    for category, units in _PREFERRED_UNITS.items()
+    for unit in units
+}
+
+@lru_cache(maxsize=1)
+def _build_registry() -> pint.UnitRegistry:
+    """Build the shared unit registry on first use.
+
+    UnitRegistry construction parses pint's full definition file (tens of
+    milliseconds) and dominates the cost of creating a UnitConverter, so
+    every converter instance shares this one.
+    """
+    ureg = pint.UnitRegistry()
+    # Define common cooking unit aliases
+    ureg.define('each = 1 * dimensionless')
+    ureg.define('clove = 1 * dimensionless')
+    ureg.define('head = 1 * dimensionless')
+    ureg.define('bunch = 1 * dimensionless')
+    ureg.define('package = 1 * dimensionless')
+    ureg.define('container = 1 * dimensionless')
+    ureg.define('bottle = 1 * dimensionless')
+    ureg.define('loaf = 1 * dimensionless')
+    # Define stick of butter as 4 oz (standard US measurement)
+    ureg.define('stick = 4 * ounce')
+    return ureg
 
 class UnitConverter:
     """Handles unit conversions for cooking ingredients."""
 
     def __init__(self):
-        self.ureg = pint.UnitRegistry()
-        # Define common cooking unit aliases
-        self.ureg.define('each = 1 * dimensionless')
-        self.ureg.define('clove = 1 * dimensionless')
-        self.ureg.define('head = 1 * dimensionless')
-        self.ureg.define('bunch = 1 * dimensionless')
-        self.ureg.define('package = 1 * dimensionless')
-        self.ureg.define('container = 1 * dimensionless')
-        self.ureg.define('bottle = 1 * dimensionless')
-        self.ureg.define('loaf = 1 * dimensionless')
-        # Define stick of butter as 4 oz (standard US measurement)
-        self.ureg.define('stick = 4 * ounce')
-
-        # Define preferred units for different categories
-        self.preferred_units = {
-            # Volume units - prefer cups for cooking
-            'volume': ['cup', 'cups', 'tablespoon', 'tablespoons', 'teaspoon', 'teaspoons', 'fluid_ounce', 'fluid_ounces'],
-            # Weight units - prefer pounds for shopping
-            'weight': ['pound', 'pounds', 'ounce', 'ounces', 'gram', 'grams', 'kilogram', 'kilograms', 'stick'],
-            # Count units - keep as-is
-            'count': ['each', 'clove', 'head', 'bunch', 'package', 'container', 'bottle', 'loaf']
-        }
+        self.ureg = _build_registry()
+
+        # Preferred units for different categories
+        self.preferred_units = _PREFERRED_UNITS
 
         # Common ingredient conversions (volume to weight)
         # These are approximate conversions for common cooking ingredients
@@ -47,114 +84,173 @@ class UnitConverter:
             'count': 'each'  # Keep count units as-is mostly
         }
 
-    def normalize_unit_name(self, unit_str: str) -> str:
-        """Normalize unit names to standard forms."""
+        # One precompiled alternation scans the ingredient name in C
+        # instead of a Python loop over the conversion keys
+        self._ing_re = re.compile("|".join(re.escape(key) for key in self.ingredient_conversions))
+
+        # Caches: pint re-parses unit strings on every Quantity/.to() call,
+        # so keep parsed Unit objects and linear conversion factors around
+        self._unit_cache: Dict[str, pint.Unit] = {}
+        self._factor_cache: Dict[Tuple[str, str, str], Optional[float]] = {}
+
+        # Base-factor table generated from pint once: each known unit maps
+        # to (base_unit, multiplier to base), so same-category conversions
+        # reduce to two dict lookups and a divide — pint is only consulted
+        # for units outside the table
+        self._base: Dict[str, Tuple[str, float]] = {}
+        for category, base_unit in (('volume', 'cup'), ('weight', 'ounce')):
+            base = self._unit(base_unit)
+            for unit in self.preferred_units[category]:
+                self._base[unit] = (
+                    base_unit,
+                    float(self.ureg.Quantity(1.0, self._unit(unit)).to(base).magnitude),
+                )
+
+        # Precompute convertibility for every ordered pair of known units,
+        # so can_convert is a frozenset lookup instead of a pint conversion
+        # attempt (and the expensive exception it throws on failure)
+        compat = set()
+        known_units = {u for units in self.preferred_units.values() for u in units}
+        for a in known_units:
+            for b in known_units:
+                try:
+                    self.ureg.Quantity(1, self._unit(a)).to(self._unit(b))
+                    compat.add((a, b))
+                except (DimensionalityError, UndefinedUnitError, KeyError):
+                    pass
+        self._compat = frozenset(compat)
+
+    def _unit(self, name: str) -> pint.Unit:
+        """Parse a unit name once and reuse the pint Unit object."""
+        unit = self._unit_cache.get(name)
+        if unit is None:
+            unit = self.ureg.parse_units(name)
+            self._unit_cache[name] = unit
+        return unit
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def normalize_unit_name(unit_str: str) -> str:
+        """Normalize unit names to standard forms.
+
+        Memoized on the raw string: a large CSV has thousands of rows but
+        rarely more than a couple dozen distinct unit spellings, so repeat
+        spellings skip the lower/strip.
+        """
         unit_str = unit_str.lower().strip()
-
-        # Handle common variations
-        unit_mappings = {
-            'lb': 'pound', 'lbs': 'pound', 'pounds': 'pound',
-            'oz': 'ounce', 'ounces': 'ounce',
-            'c': 'cup', 'cups': 'cup',
-            'tbsp': 'tablespoon', 'tablespoons': 'tablespoon', 'tbs': 'tablespoon',
-            'tsp': 'teaspoon', 'teaspoons': 'teaspoon', 'ts': 'teaspoon',
-            'fl oz': 'fluid_ounce', 'fluid oz': 'fluid_ounce', 'fl_oz': 'fluid_ounce',
-            'g': 'gram', 'grams': 'gram',
-            'kg': 'kilogram', 'kilograms': 'kilogram',
-        }
-
-        return unit_mappings.get(unit_str, unit_str)
+        return _UNIT_MAPPINGS.get(unit_str, unit_str)
 
     def get_unit_category(self, unit_str: str) -> str:
         """Determine the category of a unit (volume, weight, count)."""
-        normalized = self.normalize_unit_name(unit_str)
-
-        for category, units in self.preferred_units.items():
-            if normalized in units:
-                return category
+        return self._category_of_normalized(self.normalize_unit_name(unit_str))
 
-        return 'count'  # Default to count for unknown units
+    @staticmethod
+    def _category_of_normalized(normalized_unit: str) -> str:
+        """Category lookup for an already-normalized unit name."""
+        # Default to count for unknown units
+        return _UNIT_TO_CATEGORY.get(normalized_unit, 'count')
 
     def can_convert(self, from_unit: str, to_unit: str, ingredient: str = None) -> bool:
         """Check if two units can be converted between each other."""
+        from_normalized = self.normalize_unit_name(from_unit)
+        to_normalized = self.normalize_unit_name(to_unit)
+
+        # Same unit category check (args are already normalized above)
+        from_category = self._category_of_normalized(from_normalized)
+        to_category = self._category_of_normalized(to_normalized)
+
+        # Allow volume-weight conversions for specific ingredients
+        if ingredient and from_category != to_category:
+            if self._ing_re.search(ingredient.lower()):
+                # Allow conversion between volume and weight for this ingredient
+                if (from_category == 'volume' and to_category == 'weight') or \
+                   (from_category == 'weight' and to_category == 'volume'):
+                    return True
+
+        if from_category != to_category:
+            return False
+
+        # Precomputed matrix covers every known unit pair
+        if (from_normalized, to_normalized) in self._compat:
+            return True
+        if from_normalized in _UNIT_TO_CATEGORY and to_normalized in _UNIT_TO_CATEGORY:
+            return False
+
+        # Unknown units fall back to a one-off pint attempt
         try:
-            from_normalized = self.normalize_unit_name(from_unit)
-            to_normalized = self.normalize_unit_name(to_unit)
-
-            # Same unit category check
-            from_category = self.get_unit_category(from_normalized)
-            to_category = self.get_unit_category(to_normalized)
-
-            # Allow volume-weight conversions for specific ingredients
-            if ingredient and from_category != to_category:
-                ingredient_lower = ingredient.lower()
-                for ing_key in self.ingredient_conversions.keys():
-                    if ing_key in ingredient_lower:
-                        # Allow conversion between volume and weight for this ingredient
-                        if (from_category == 'volume' and to_category == 'weight') or \
-                           (from_category == 'weight' and to_category == 'volume'):
-                            return True
-
-            if from_category != to_category:
-                return False
-
-            # Try actual conversion
-            from_qty = self.ureg.Quantity(1, from_normalized)
-            to_qty = from_qty.to(to_normalized)
+            self.ureg.Quantity(1, self._unit(from_normalized)).to(self._unit(to_normalized))
             return True
-        except:
+        except (DimensionalityError, UndefinedUnitError, KeyError, ValueError):
             return False
 
     def convert_quantity(self, quantity: float, from_unit: str, to_unit: str, ingredient: str = None) -> Optional[float]:
         """Convert quantity from one unit to another, with ingredient-specific conversions."""
-        try:
-            from_normalized = self.normalize_unit_name(from_unit)
-            to_normalized = self.normalize_unit_name(to_unit)
-
-            # Try ingredient-specific conversion first
-            if ingredient and self._try_ingredient_conversion(quantity, from_normalized, to_normalized, ingredient.lower()):
-                return self._try_ingredient_conversion(quantity, from_normalized, to_normalized, ingredient.lower())
-
-            # Fall back to standard unit conversion
-            from_qty = self.ureg.Quantity(quantity, from_normalized)
-            to_qty = from_qty.to(to_normalized)
-            result = float(to_qty.magnitude)
-
-            # Round to reasonable precision
-            if result < 0.01:
-                return round(result, 4)
-            elif result < 0.1:
-                return round(result, 3)
-            elif result < 1:
-                return round(result, 2)
-            else:
-                return round(result, 1)
-        except:
-            return None
+        from_normalized = self.normalize_unit_name(from_unit)
+        to_normalized = self.normalize_unit_name(to_unit)
+
+        # Same unit, nothing to do
+        if from_normalized == to_normalized:
+            return quantity
 
-    def _try_ingredient_conversion(self, quantity: float, from_unit: str, to_unit: str, ingredient: str) -> Optional[float]:
-        """Try ingredient-specific volume-weight conversions."""
+        factor = self._get_conversion_factor(
+            from_normalized, to_normalized, ingredient.lower() if ingredient else ''
+        )
+        if factor is None:
+            return None
+        # Raw value: rounding happens once per output row in _format_qty,
+        # so converted quantities sum without accumulating rounding error
+        return quantity * factor
+
+    def _get_conversion_factor(self, from_unit: str, to_unit: str, ingredient: str) -> Optional[float]:
+        """Per-unit multiplier from from_unit to to_unit, or None.
+
+        Cooking conversions are linear, so the factor computed once per
+        (from, to, ingredient) triple covers every quantity; repeat
+        conversions become a dict lookup and a multiply.
+        """
+        cache_key = (from_unit, to_unit, ingredient)
+        if cache_key in self._factor_cache:
+            return self._factor_cache[cache_key]
+
+        # Try ingredient-specific conversion first
+        factor = self._ingredient_factor(from_unit, to_unit, ingredient) if ingredient else None
+
+        # Same-category conversions go through the precomputed base table
+        if factor is None:
+            from_base = self._base.get(from_unit)
+            to_base = self._base.get(to_unit)
+            if from_base is not None and to_base is not None and from_base[0] == to_base[0]:
+                factor = from_base[1] / to_base[1]
+
+        # Fall back to standard unit conversion
+        if factor is None:
+            try:
+                factor = float(self.ureg.Quantity(1.0, self._unit(from_unit)).to(self._unit(to_unit)).magnitude)
+            except (DimensionalityError, UndefinedUnitError, KeyError, ValueError):
+                factor = None
+
+        self._factor_cache[cache_key] = factor
+        return factor
+
+    def _ingredient_factor(self, from_unit: str, to_unit: str, ingredient: str) -> Optional[float]:
+        """Per-unit factor for ingredient-specific volume-weight conversions."""
         # Check if we have conversion data for this ingredient
-        for ing_key, conversion_data in self.ingredient_conversions.items():
-            if ing_key in ingredient:
-                try:
-                    # Convert through the ingredient's density
-                    if from_unit == 'cup' and to_unit in ['ounce', 'pound']:
-                        # Cup to weight
-                        ounces = quantity * conversion_data['density_factor']
-                        if to_unit == 'pound':
-                            return round(ounces / 16, 2)
-                        return round(ounces, 1)
-                    elif from_unit in ['ounce', 'pound'] and to_unit == 'cup':
-                        # Weight to cup
-                        if from_unit == 'pound':
-                            ounces = quantity * 16
-                        else:
-                            ounces = quantity
-                        cups = ounces / conversion_data['density_factor']
-                        return round(cups, 2)
-                except:
-                    pass
+        match = self._ing_re.search(ingredient)
+        if not match:
+            return None
+        conversion_data = self.ingredient_conversions[match.group(0)]
+
+        # Convert through the ingredient's density
+        if from_unit == 'cup' and to_unit in ['ounce', 'pound']:
+            # Cup to weight
+            ounces_per_cup = conversion_data['density_factor']
+            if to_unit == 'pound':
+                return ounces_per_cup / 16
+            return ounces_per_cup
+        elif from_unit in ['ounce', 'pound'] and to_unit == 'cup':
+            # Weight to cup
+            ounces = 16.0 if from_unit == 'pound' else 1.0
+            return ounces / conversion_data['density_factor']
         return None
 
     def find_best_common_unit(self, units_list: List[str]) -> str:
@@ -162,21 +258,46 @@ class UnitConverter:
         if not units_list:
             return 'each'
 
-        # If all units are the same, use that
-        unique_units = list(set(self.normalize_unit_name(u) for u in units_list))
-        if len(unique_units) == 1:
-            return unique_units[0]
+        # If all units are the same - the overwhelmingly common case - use
+        # that, without allocating a set
+        normalize = self.normalize_unit_name
+        first = normalize(units_list[0])
+        if all(normalize(u) == first for u in units_list[1:]):
+            return first
 
-        # Find the category of the first unit
-        first_category = self.get_unit_category(unique_units[0])
+        unique_units = list(set(normalize(u) for u in units_list))
+
+        # Find the category of the first unit (unique_units are normalized)
+        first_category = self._category_of_normalized(unique_units[0])
 
         # Check if all units are in the same category
-        if all(self.get_unit_category(u) == first_category for u in unique_units):
+        if all(self._category_of_normalized(u) == first_category for u in unique_units):
             return self.output_preferences.get(first_category, unique_units[0])
 
         # If mixed categories, can't convert - return the first unit
         return units_list[0]
 
+def _format_qty(value: float) -> float:
+    """Round a quantity to display precision, once per output row."""
+    if value < 0.01:
+        return round(value, 4)
+    elif value < 0.1:
+        return round(value, 3)
+    elif value < 1:
+        return round(value, 2)
+    else:
+        return round(value, 1)
+
+@dataclass(slots=True)
+class CleanedRow:
+    """A validated input row; slotted to avoid a per-row dict."""
+    ingredient: str
+    location: str
+    quantity: float
+    units: str
+    price: float
+    done: bool
+
 class DataDefaults:
     """Configuration class for default values when data is missing."""
     def __init__(self):
@@ -186,89 +307,138 @@ class DataDefaults:
         self.units = "each"
         self.ingredient = "Unknown Item"
 
+# Cap on stored warnings: a huge CSV full of bad rows should not grow
+# memory without bound just to print a summary
+_MAX_WARNINGS = 1000
+
 class DataValidator:
     """Handles data validation and provides warnings for missing/invalid data."""
+    # Warning text is rendered here at print time; the validation loop
+    # stores (row_num, code, payload) tuples instead of building f-strings
+    # for output that may never be shown
+    _WARNING_TEXT = {
+        'missing_ingredient': lambda payload, d: "Missing ingredient name",
+        'missing_location': lambda payload, d: f"Missing location, using '{d.location}'",
+        'bad_qty': lambda payload, d: f"Invalid quantity '{payload}', using default ({d.quantity})",
+        'neg_qty': lambda payload, d: f"Negative quantity ({payload}), using default",
+        'missing_units': lambda payload, d: f"Missing units, using '{d.units}'",
+        'bad_price': lambda payload, d: f"Invalid price '{payload}', using default ({d.price})",
+        'neg_price': lambda payload, d: f"Negative price ({payload}), using default",
+        'skipped': lambda payload, d: "Skipping row due to missing critical data",
+    }
+
     def __init__(self, defaults: DataDefaults):
         self.defaults = defaults
-        self.warnings: List[str] = []
+        self.warnings: List[Tuple[int, str, Any]] = []
+        self.total_warnings = 0
         self.row_count = 0
         self.skipped_rows = 0
+        self._col: Optional[Dict[str, Optional[int]]] = None
+
+    def _warn(self, row_num: int, code: str, payload: Any = None):
+        """Count a warning, keeping only the first _MAX_WARNINGS for display."""
+        self.total_warnings += 1
+        if self.total_warnings <= _MAX_WARNINGS:
+            self.warnings.append((row_num, code, payload))
+
+    def prepare(self, headers: List[str]):
+        """Resolve column positions once so rows can stay plain lists.
+
+        csv.DictReader builds a dict per row just to look fields up by
+        header name; resolving the indices up front lets validate_row
+        work straight off csv.reader's lists.
+        """
+        lookup = {header.strip(): i for i, header in enumerate(headers)}
+        self._col = {
+            name: lookup.get(name)
+            for name in ("Ingredient", "Qty", "Units", "Location", "Price", "Done?")
+        }
 
-    def validate_row(self, row: Dict[str, str], row_num: int) -> Dict[str, Any]:
+    def validate_row(self, row: List[str], row_num: int) -> Optional[CleanedRow]:
         """Validate and clean a single row of data."""
         self.row_count += 1
-        cleaned_row = {}
         has_critical_missing = False
 
+        col = self._col
+        n_fields = len(row)
+
+        def field(name: str) -> str:
+            idx = col[name]
+            return row[idx] if idx is not None and idx < n_fields else ""
+
         # Validate ingredient (critical field)
-        ingredient = row.get("Ingredient", "").strip()
+        ingredient = field("Ingredient").strip()
         if not ingredient:
-            self.warnings.append(f"Row {row_num}: Missing ingredient name")
+            self._warn(row_num, 'missing_ingredient')
             ingredient = self.defaults.ingredient
             has_critical_missing = True
-        cleaned_row["ingredient"] = ingredient
 
         # Validate location
-        location = row.get("Location", "").strip()
+        location = field("Location").strip()
         if not location:
-            self.warnings.append(f"Row {row_num}: Missing location, using '{self.defaults.location}'")
+            self._warn(row_num, 'missing_location')
             location = self.defaults.location
-        cleaned_row["location"] = location
 
         # Validate quantity
-        qty_str = row.get("Qty", "").strip()
+        qty_str = field("Qty").strip()
         try:
             quantity = float(qty_str) if qty_str else self.defaults.quantity
             if quantity < 0:
-                self.warnings.append(f"Row {row_num}: Negative quantity ({quantity}), using default")
+                self._warn(row_num, 'neg_qty', quantity)
                 quantity = self.defaults.quantity
         except ValueError:
-            self.warnings.append(f"Row {row_num}: Invalid quantity '{qty_str}', using default ({self.defaults.quantity})")
+            self._warn(row_num, 'bad_qty', qty_str)
             quantity = self.defaults.quantity
-        cleaned_row["quantity"] = quantity
 
         # Validate units
-        units = row.get("Units", "").strip()
+        units = field("Units").strip()
         if not units:
-            self.warnings.append(f"Row {row_num}: Missing units, using '{self.defaults.units}'")
+            self._warn(row_num, 'missing_units')
             units = self.defaults.units
-        cleaned_row["units"] = units
 
         # Validate price
-        price_str = row.get("Price", "").strip()
+        price_str = field("Price").strip()
         try:
             price = float(price_str) if price_str else self.defaults.price
             if price < 0:
-                self.warnings.append(f"Row {row_num}: Negative price ({price}), using default")
+                self._warn(row_num, 'neg_price', price)
                 price = self.defaults.price
         except ValueError:
-            self.warnings.append(f"Row {row_num}: Invalid price '{price_str}', using default ({self.defaults.price})")
+            self._warn(row_num, 'bad_price', price_str)
             price = self.defaults.price
-        cleaned_row["price"] = price
 
         # Check "Done?" field
-        done = row.get("Done?", "").strip().lower()
-        cleaned_row["done"] = done in ("1", "true", "yes")
+        done = field("Done?").strip().lower()
 
         # Skip rows with critical missing data if ingredient is still unknown
         if has_critical_missing and ingredient == self.defaults.ingredient:
-            self.warnings.append(f"Row {row_num}: Skipping row due to missing critical data")
+            self._warn(row_num, 'skipped')
             self.skipped_rows += 1
             return None
 
-        return cleaned_row
+        return CleanedRow(
+            ingredient=intern(ingredient),
+            location=intern(location),
+            quantity=quantity,
+            units=intern(units),
+            price=price,
+            done=done in ("1", "true", "yes"),
+        )
 
     def print_summary(self):
         """Print a summary of data validation results."""
         print(f"\nData Validation Summary:")
         print(f"  Total rows processed: {self.row_count}")
         print(f"  Rows skipped: {self.skipped_rows}")
-        print(f"  Warnings generated: {len(self.warnings)}")
+        print(f"  Warnings generated: {self.total_warnings}")
 
         if self.warnings:
             print(f"\nWarnings:")
-            for warning in self.warnings:
-                print(f"  ⚠️  {warning}")
+            text = self._WARNING_TEXT
+            for row_num, code, payload in self.warnings:
+                print(f"  ⚠️  Row {row_num}: {text[code](payload, self.defaults)}")
+            if self.total_warnings > len(self.warnings):
+                print(f"  ... and {self.total_warnings - len(self.warnings)} more not shown")
 
 def generate_shopping_list(input_path: str, output_path: str, defaults: DataDefaults = None, enable_unit_conversion: bool = True):
     """Generate a consolidated shopping list from ingredient CSV with robust data validation and unit conversion."""
@@ -276,58 +446,81 @@ def generate_shopping_list(input_path: str, output_path: str, defaults: DataDefa
         defaults = DataDefaults()
 
     validator = DataValidator(defaults)
-    converter = UnitConverter() if enable_unit_conversion else None
-
-    # First pass: collect all data without unit conversion
-    raw_items = []
-
-    with open(input_path, newline='') as infile:
-        reader = csv.DictReader(infile)
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 since row 1 is headers
-            # Validate and clean the row data
-            cleaned_row = validator.validate_row(row, row_num)
-
-            # Skip invalid rows
-            if cleaned_row is None:
-                continue
-
-            # Skip items already bought
-            if cleaned_row["done"]:
-                continue
-
-            raw_items.append(cleaned_row)
+    # Built lazily: the pint registry and the converter's precomputed
+    # tables are wasted setup when no group actually has mixed units
+    converter = None
+
+    # Parallel aggregators keyed by (location, ingredient, units): a pair of
+    # flat dicts means one hash per update, with no inner per-key dict
+    qty_totals = {}
+    price_totals = {}
+    conversion_summary = []
 
-    # Second pass: group by location and ingredient, then handle unit conversion
-    # Group items by (location, ingredient) first
-    ingredient_groups = defaultdict(list)
-    for item in raw_items:
-        key = (item["location"], item["ingredient"])
-        ingredient_groups[key].append(item)
+    # Large buffer amortizes read syscalls; explicit encoding skips the
+    # platform-default lookup and keeps behavior identical across systems
+    with open(input_path, newline='', buffering=1 << 20, encoding='utf-8') as infile:
+        # csv.reader + precomputed column indices instead of csv.DictReader,
+        # which would allocate a header-keyed dict per row
+        reader = csv.reader(infile)
+        headers = next(reader, [])
+        validator.prepare(headers)
+
+        if not enable_unit_conversion:
+            # No conversion: aggregate straight into totals as rows stream in,
+            # skipping the intermediate per-ingredient grouping entirely
+            for row_num, row in enumerate(reader, start=2):  # Start at 2 since row 1 is headers
+                if not row:  # DictReader skipped blank lines; keep doing so
+                    continue
+                cleaned_row = validator.validate_row(row, row_num)
+                if cleaned_row is None or cleaned_row.done:
+                    continue
+                key = (cleaned_row.location, cleaned_row.ingredient, cleaned_row.units)
+                qty_totals[key] = qty_totals.get(key, 0.0) + cleaned_row.quantity
+                price_totals[key] = price_totals.get(key, 0.0) + cleaned_row.price
+            ingredient_groups = {}
+        else:
+            # Validate and group by (location, ingredient) in one pass
+            ingredient_groups = defaultdict(list)
+            for row_num, row in enumerate(reader, start=2):  # Start at 2 since row 1 is headers
+                if not row:  # DictReader skipped blank lines; keep doing so
+                    continue
+                cleaned_row = validator.validate_row(row, row_num)
+                if cleaned_row is None or cleaned_row.done:
+                    continue
+                ingredient_groups[(cleaned_row.location, cleaned_row.ingredient)].append(cleaned_row)
 
     # Process each group with unit conversion
-    totals = {}
-    conversion_summary = []
-
     for (location, ingredient), items in ingredient_groups.items():
-        if not enable_unit_conversion or len(items) == 1:
-            # No conversion needed - just aggregate normally
-            for item in items:
-                key = (location, ingredient, item["units"])
-                if key not in totals:
-                    totals[key] = {"quantity": 0.0, "price": 0.0}
-                totals[key]["quantity"] += item["quantity"]
-                totals[key]["price"] += item["price"]
+        units_in_group = [item.units for item in items]
+        normalized_units = {
+            UnitConverter.normalize_unit_name(unit) for unit in units_in_group
+        }
+        if len(normalized_units) == 1:
+            # Everything already shares a unit - plain summation, no converter.
+            # Compare and emit the normalized spelling so the output matches
+            # what the converter would have produced ("Cups" rows total
+            # under "cup")
+            key = (location, ingredient, next(iter(normalized_units)))
+            qty_totals[key] = sum(item.quantity for item in items)
+            price_totals[key] = sum(item.price for item in items)
         else:
             # Try to convert units for this ingredient
-            units_in_group = [item["units"] for item in items]
+            if converter is None:
+                converter = UnitConverter()
             best_unit = converter.find_best_common_unit(units_in_group)
 
-            # Check if we can convert all items to the best unit
+            # Decide convertibility once per distinct source unit rather
+            # than per item; groups rarely have more than a few units
+            convertible_units = {
+                unit for unit in set(units_in_group)
+                if unit == best_unit or converter.can_convert(unit, best_unit, ingredient)
+            }
+
             convertible_items = []
             non_convertible_items = []
 
             for item in items:
-                if item["units"] == best_unit or converter.can_convert(item["units"], best_unit, ingredient):
+                if item.units in convertible_units:
                     convertible_items.append(item)
                 else:
                     non_convertible_items.append(item)
@@ -338,23 +531,29 @@ def generate_shopping_list(input_path: str, output_path: str, defaults: DataDefa
                 total_price = 0.0
                 original_quantities = []
 
+                # Compare normalized names so "Cup" vs "cup" items skip the
+                # converter call entirely
+                normalize = converter.normalize_unit_name
+                best_normalized = normalize(best_unit)
+
                 for item in convertible_items:
-                    if item["units"] == best_unit:
-                        converted_qty = item["quantity"]
+                    if normalize(item.units) == best_normalized:
+                        converted_qty = item.quantity
                     else:
-                        converted_qty = converter.convert_quantity(item["quantity"], item["units"], best_unit, ingredient)
+                        converted_qty = converter.convert_quantity(item.quantity, item.units, best_unit, ingredient)
                         if converted_qty is None:
                             # Conversion failed, treat as non-convertible
                             non_convertible_items.append(item)
                             continue
 
                     converted_quantity += converted_qty
-                    total_price += item["price"]
-                    original_quantities.append(f"{item['quantity']} {item['units']}")
+                    total_price += item.price
+                    original_quantities.append(f"{item.quantity} {item.units}")
 
                 if converted_quantity > 0:
                     key = (location, ingredient, best_unit)
-                    totals[key] = {"quantity": converted_quantity, "price": total_price}
+                    qty_totals[key] = converted_quantity
+                    price_totals[key] = total_price
 
                     if len(convertible_items) > 1:
                         # Format the final quantity nicely
@@ -370,11 +569,9 @@ def generate_shopping_list(input_path: str, output_path: str, defaults: DataDefa
 
             # Handle non-convertible items separately
             for item in non_convertible_items:
-                key = (location, ingredient, item["units"])
-                if key not in totals:
-                    totals[key] = {"quantity": 0.0, "price": 0.0}
-                totals[key]["quantity"] += item["quantity"]
-                totals[key]["price"] += item["price"]
+                key = (location, ingredient, item.units)
+                qty_totals[key] = qty_totals.get(key, 0.0) + item.quantity
+                price_totals[key] = price_totals.get(key, 0.0) + item.price
 
     # Print validation summary
     validator.print_summary()
@@ -385,15 +582,18 @@ def generate_shopping_list(input_path: str, output_path: str, defaults: DataDefa
         for conversion in conversion_summary:
             print(conversion)
 
-    # write out the aggregated shopping list
-    with open(output_path, "w", newline='') as outfile:
+    # write out the aggregated shopping list; one writerows call keeps the
+    # row loop in C, and the large buffer batches the underlying writes
+    with open(output_path, "w", newline='', buffering=1 << 20, encoding='utf-8') as outfile:
         writer = csv.writer(outfile)
         writer.writerow(["Location", "Ingredient", "Qty", "Units", "Price"])
-        for (loc, ing, unit), vals in sorted(totals.items()):
-            writer.writerow([loc, ing, vals["quantity"], unit, vals["price"]])
+        writer.writerows(
+            (key[0], key[1], _format_qty(qty_totals[key]), key[2], price_totals[key])
+            for key in sorted(qty_totals)
+        )
 
     print(f"\nShopping list written to: {output_path}")
-    print(f"Total unique items: {len(totals)}")
+    print(f"Total unique items: {len(qty_totals)}")
 
 def main():
     parser = argparse.ArgumentParser(